@@ -0,0 +1,326 @@
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from aoc2020.benchmark import (
+    BOTH_PARTS,
+    BenchmarkHistory,
+    Comparison,
+    MemoryUsage,
+    PartBenchmark,
+    SCALING_TARGETS,
+    TIME_NOISE_FLOOR_US,
+    ScalingResult,
+    benchmark_day,
+    compare_revisions,
+    current_revision,
+    measure_day_memory,
+    measure_scaling,
+)
+from aoc2020.runner import parse_days
+from aoc2020.solvers import enable_parse_cache
+
+if TYPE_CHECKING:
+    from aoc2020.profiling import CProfiler
+
+logger = logging.getLogger("AoCBench")
+
+
+def _format_ms(value_ns: float) -> str:
+    return f"{value_ns / 1e6:.3f}"
+
+
+def _format_part(part: int) -> str:
+    return "both" if part == BOTH_PARTS else str(part)
+
+
+def format_table(results: List[PartBenchmark]) -> str:
+    header = (
+        f"{'day':>4} {'part':>4} {'min ms':>11} {'median ms':>11} "
+        f"{'mean ms':>11} {'p95 ms':>11} {'stddev ms':>11} {'items/s':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for res in results:
+        lines.append(
+            f"{res.day:>4} {_format_part(res.part):>4} "
+            f"{_format_ms(res.stats.min):>11} "
+            f"{_format_ms(res.stats.median):>11} "
+            f"{_format_ms(res.stats.mean):>11} "
+            f"{_format_ms(res.stats.p95):>11} "
+            f"{_format_ms(res.stats.stddev):>11} "
+            f"{res.items_per_second:>12.0f}"
+        )
+    return "\n".join(lines)
+
+
+def _format_mib(value: Optional[int]) -> str:
+    return "-" if value is None else f"{value / 2**20:.1f}"
+
+
+def format_memory_table(memory: Dict[int, Dict[str, MemoryUsage]]) -> str:
+    header = f"{'day':>4} {'phase':>8} {'rss MiB':>10} {'heap MiB':>10}"
+    lines = [header, "-" * len(header)]
+    for day, phases in sorted(memory.items()):
+        for phase, usage in phases.items():
+            lines.append(
+                f"{day:>4} {phase:>8} {_format_mib(usage.peak_rss):>10} "
+                f"{_format_mib(usage.peak_heap):>10}"
+            )
+    return "\n".join(lines)
+
+
+def _format_change(change: Optional[float]) -> str:
+    return "-" if change is None else f"{change*100:+.1f}%"
+
+
+def format_comparison(comparisons: List[Comparison]) -> str:
+    header = (
+        f"{'day':>4} {'part':>4} {'base ms':>11} {'head ms':>11} "
+        f"{'change':>8} {'noise ms':>10} {'heap':>8}  status"
+    )
+    lines = [header, "-" * len(header)]
+    for comp in comparisons:
+        lines.append(
+            f"{comp.day:>4} {_format_part(comp.part):>4} "
+            f"{_format_ms(comp.base.stats.median):>11} "
+            f"{_format_ms(comp.head.stats.median):>11} "
+            f"{_format_change(comp.change):>8} "
+            f"{_format_ms(comp.noise):>10} "
+            f"{_format_change(comp.memory_change):>8}  "
+            f"{'REGRESSION' if comp.regression else 'ok'}"
+        )
+    return "\n".join(lines)
+
+
+def format_scaling(results: List[ScalingResult]) -> str:
+    lines: List[str] = []
+    for res in results:
+        flag = "  <-- worse than linear" if res.superlinear else ""
+        lines.append(
+            f"{res.target}: {res.complexity} "
+            f"(log-log slope {res.exponent:.2f}){flag}"
+        )
+        lines.append(f"  {'n':>8} {'time ms':>11} {'peak KiB':>11}")
+        for point in res.points:
+            lines.append(
+                f"  {point.size:>8} {point.duration*1000:>11.3f} "
+                f"{point.peak_memory/1024:>11.1f}"
+            )
+    return "\n".join(lines)
+
+
+def run_benchmarks(
+    days: List[int],
+    warmup: int,
+    repeats: int,
+    demo: bool,
+    memory: Optional[Dict[int, Dict[str, MemoryUsage]]] = None,
+    profiler: Optional["CProfiler"] = None,
+) -> List[PartBenchmark]:
+    results: List[PartBenchmark] = []
+    for day in days:
+        logger.info(f"Benchmarking day {day}")
+        # A failing day should not cost the measurements of the others
+        try:
+            results.extend(
+                benchmark_day(
+                    day=day,
+                    warmup=warmup,
+                    repeats=repeats,
+                    demo=demo,
+                    memory=memory.get(day) if memory is not None else None,
+                    profiler=profiler,
+                )
+            )
+        except Exception:
+            logger.exception(f"Benchmarking day {day} failed")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark advent of code puzzle solvers"
+    )
+    parser.add_argument(
+        "-v", "--verbose", help="Output debug logging", action="store_true"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser("run", help="Benchmark solvers")
+    run_parser.add_argument(
+        "day",
+        nargs="?",
+        default="all",
+        help="Day(s) to benchmark: a day, 'all', a range such as '1-25' or "
+             "a comma separated list",
+    )
+    run_parser.add_argument(
+        "-w", "--warmup", type=int, default=1,
+        help="Number of unmeasured warmup rounds per part",
+    )
+    run_parser.add_argument(
+        "-r", "--repeats", type=int, default=5,
+        help="Number of measured rounds per part",
+    )
+    run_parser.add_argument(
+        "-d", "--demo", help="Benchmark on demo input", action="store_true"
+    )
+    run_parser.add_argument(
+        "-m", "--memory", action="store_true",
+        help="Also measure peak memory of each phase in a fresh process",
+    )
+    run_parser.add_argument(
+        "--profile", type=Path, nargs="?", default=None,
+        const=Path("profiles"), metavar="DIR",
+        help="After measuring, run construction and each part once more "
+             "under cProfile and write the pstats files to DIR",
+    )
+    run_parser.add_argument(
+        "--profile-top", type=int, default=15, metavar="N",
+        help="Number of functions to print per profile",
+    )
+    run_parser.add_argument(
+        "--parse-cache", action="store_true",
+        help="Cache parsed inputs on disk, keyed by input and parser version",
+    )
+    run_parser.add_argument(
+        "--no-save", action="store_true",
+        help="Do not store the results in the benchmark history",
+    )
+    run_parser.add_argument(
+        "--revision", default=None,
+        help="Revision to store the results under (defaults to git HEAD)",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare the stored results of two revisions"
+    )
+    compare_parser.add_argument(
+        "base",
+        help="Base revision, with a -dirty suffix to select runs with "
+             "uncommitted changes",
+    )
+    compare_parser.add_argument(
+        "head", nargs="?", default=None,
+        help="Revision to check (defaults to git HEAD)",
+    )
+    compare_parser.add_argument(
+        "-t", "--threshold", type=float, default=0.05,
+        help="Relative slowdown of the median that counts as a regression",
+    )
+    compare_parser.add_argument(
+        "-n", "--noise-factor", type=float, default=2.,
+        help="Slowdown must also exceed this many times the measured noise",
+    )
+    compare_parser.add_argument(
+        "--min-delta-us", type=float, default=TIME_NOISE_FLOOR_US,
+        metavar="US",
+        help="Slowdown of the median must also exceed this many "
+             "microseconds, so jitter on very fast parts is not flagged",
+    )
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="Fit the order of growth on synthetic inputs"
+    )
+    scaling_parser.add_argument(
+        "targets", nargs="*", default=list(SCALING_TARGETS),
+        help=f"Targets to measure, from {', '.join(SCALING_TARGETS)}",
+    )
+    scaling_parser.add_argument(
+        "-r", "--repeats", type=int, default=3,
+        help="Number of measured rounds per input size",
+    )
+
+    for sub in [run_parser, compare_parser]:
+        sub.add_argument(
+            "--history", type=Path, default=None,
+            help="Benchmark history file (defaults to the user cache dir)",
+        )
+
+    args = parser.parse_args()
+    if args.verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.WARNING
+    logging.basicConfig(level=level)
+
+    if args.command == "run":
+        if args.parse_cache:
+            enable_parse_cache()
+        if args.repeats < 1 or args.warmup < 0:
+            parser.error(f"Need at least one repeat and no negative warmup")
+        try:
+            days = parse_days(args.day)
+        except ValueError as e:
+            parser.error(str(e))
+        memory: Optional[Dict[int, Dict[str, MemoryUsage]]] = None
+        if args.memory:
+            memory = {}
+            for day in days:
+                logger.info(f"Measuring memory of day {day}")
+                try:
+                    memory[day] = measure_day_memory(day=day, demo=args.demo)
+                except RuntimeError as e:
+                    logger.error(str(e))
+        profiler = None
+        if args.profile is not None:
+            # Imported here, it would slow down the startup of every run
+            from aoc2020.profiling import CProfiler
+
+            profiler = CProfiler(output_dir=args.profile, top=args.profile_top)
+        results = run_benchmarks(
+            days=days,
+            warmup=args.warmup,
+            repeats=args.repeats,
+            demo=args.demo,
+            memory=memory,
+            profiler=profiler,
+        )
+        print(format_table(results))
+        if memory is not None:
+            print()
+            print(format_memory_table(memory))
+        if profiler is not None:
+            from aoc2020.profiling import format_stats
+
+            for stats_file in profiler.written:
+                print()
+                print(format_stats(stats_file, top=profiler.top))
+        if not args.no_save:
+            revision = args.revision or current_revision()
+            BenchmarkHistory(path=args.history).append(
+                revision=revision, results=results
+            )
+            logger.info(f"Stored results for revision {revision}")
+    elif args.command == "compare":
+        head = args.head or current_revision()
+        comparisons = compare_revisions(
+            history=BenchmarkHistory(path=args.history),
+            base=args.base,
+            head=head,
+            threshold=args.threshold,
+            noise_factor=args.noise_factor,
+            min_delta_us=args.min_delta_us,
+        )
+        if len(comparisons) == 0:
+            logger.error(f"No common results for {args.base} and {head}")
+            sys.exit(2)
+        print(format_comparison(comparisons))
+        if any(comp.regression for comp in comparisons):
+            sys.exit(1)
+    elif args.command == "scaling":
+        unknown = set(args.targets) - set(SCALING_TARGETS)
+        if len(unknown) > 0:
+            parser.error(f"Unknown scaling target(s) {', '.join(unknown)}")
+        scaling = [
+            measure_scaling(SCALING_TARGETS[name], repeats=args.repeats)
+            for name in args.targets
+        ]
+        print(format_scaling(scaling))
+
+
+if __name__ == "__main__":
+    main()
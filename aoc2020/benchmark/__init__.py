@@ -0,0 +1,47 @@
+from .bench import (
+    BOTH_PARTS,
+    PartBenchmark,
+    benchmark_day,
+    benchmark_solver,
+    time_function,
+)
+from .compare import TIME_NOISE_FLOOR_US, Comparison, compare_revisions
+from .history import (
+    BenchmarkHistory,
+    HistoryRecord,
+    current_revision,
+    split_revision,
+)
+from .memory import MemoryUsage, measure_day_memory, measure_memory
+from .scaling import (
+    SCALING_TARGETS,
+    ScalingPoint,
+    ScalingResult,
+    ScalingTarget,
+    measure_scaling,
+)
+from .stats import TimingStats
+
+__all__ = [
+    "BOTH_PARTS",
+    "BenchmarkHistory",
+    "Comparison",
+    "HistoryRecord",
+    "MemoryUsage",
+    "PartBenchmark",
+    "SCALING_TARGETS",
+    "TIME_NOISE_FLOOR_US",
+    "ScalingPoint",
+    "ScalingResult",
+    "ScalingTarget",
+    "TimingStats",
+    "benchmark_day",
+    "benchmark_solver",
+    "compare_revisions",
+    "current_revision",
+    "measure_day_memory",
+    "measure_memory",
+    "measure_scaling",
+    "split_revision",
+    "time_function",
+]
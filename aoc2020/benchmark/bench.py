@@ -0,0 +1,151 @@
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from aoc2020.benchmark.memory import MemoryUsage
+from aoc2020.benchmark.stats import TimingStats
+from aoc2020.data import DataFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.utils.hashing import hash_file
+
+if TYPE_CHECKING:
+    from aoc2020.profiling import CProfiler
+
+logger = logging.getLogger("Benchmark")
+
+# Part number of the measurements of fused solve_both implementations
+BOTH_PARTS = 0
+
+
+def part_phase(part: int) -> str:
+    return "solve_both" if part == BOTH_PARTS else f"solve_{part}"
+
+
+@dataclass
+class PartBenchmark:
+    day: int
+    part: int
+    items: int  # Number of input lines
+    stats: TimingStats
+    input_hash: str = ""
+    memory: Optional[MemoryUsage] = None
+
+    @property
+    def items_per_second(self) -> float:
+        if self.stats.median <= 0:
+            return 0.
+        return self.items / (self.stats.median / 1e9)
+
+
+def count_lines(input_file: Path) -> int:
+    with input_file.open(mode="r") as f:
+        return sum(1 for line in f if len(line.strip()) > 0)
+
+
+def time_function(
+    fn: Callable[[], Any],
+    warmup: int,
+    repeats: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> TimingStats:
+    # Setup runs unmeasured before every round
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+    samples: List[int] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        a = time.perf_counter_ns()
+        fn()
+        b = time.perf_counter_ns()
+        samples.append(b - a)
+    return TimingStats(samples_ns=samples)
+
+
+def benchmark_solver(
+    day: int,
+    solver: PuzzleSolver,
+    items: int,
+    warmup: int,
+    repeats: int,
+    input_hash: str = "",
+    profiler: Optional["CProfiler"] = None,
+    is_test: bool = False,
+) -> List[PartBenchmark]:
+    results: List[PartBenchmark] = []
+    # Solvers with a fused implementation are measured on both parts at once
+    solve_fns: List[Tuple[int, Callable[[], Any]]]
+    if solver.fuses_parts():
+        solve_fns = [(BOTH_PARTS, solver.solve_both)]
+    else:
+        solve_fns = [(1, solver.solve_1), (2, solver.solve_2)]
+    for part, solve_fn in solve_fns:
+        logger.debug(f"Benchmarking day {day} part {part}")
+        # Every round starts without the intermediates of earlier rounds
+        stats = time_function(
+            fn=solve_fn,
+            warmup=warmup,
+            repeats=repeats,
+            setup=solver.reset_steps,
+        )
+        results.append(
+            PartBenchmark(
+                day=day,
+                part=part,
+                items=items,
+                stats=stats,
+                input_hash=input_hash,
+            )
+        )
+        if profiler is not None:
+            from aoc2020.profiling import profile_label
+
+            # Profiled separately, the overhead would skew the measurements
+            solver.reset_steps()
+            profiler.profile(
+                profile_label(day, is_test, part_phase(part)), solve_fn
+            )
+    return results
+
+
+def benchmark_day(
+    day: int,
+    warmup: int,
+    repeats: int,
+    demo: bool = False,
+    memory: Optional[Dict[str, MemoryUsage]] = None,
+    profiler: Optional["CProfiler"] = None,
+) -> List[PartBenchmark]:
+    if demo:
+        input_file = DataFactory.get_demo_file(day=day)
+    else:
+        input_file = DataFactory.get_input_file(day=day)
+    # Construct the solver once, only the solving itself is measured
+    if profiler is not None:
+        from aoc2020.profiling import profile_label
+
+        solver = profiler.profile(
+            profile_label(day, demo, "construct"),
+            lambda: SolverFactory.create_solver(day=day, input_file=input_file),
+        )
+    else:
+        solver = SolverFactory.create_solver(day=day, input_file=input_file)
+    results = benchmark_solver(
+        day=day,
+        solver=solver,
+        items=count_lines(input_file),
+        warmup=warmup,
+        repeats=repeats,
+        input_hash=hash_file(input_file),
+        profiler=profiler,
+        is_test=demo,
+    )
+    if memory is not None:
+        for res in results:
+            res.memory = memory.get(part_phase(res.part))
+    return results
+
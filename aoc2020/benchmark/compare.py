@@ -0,0 +1,93 @@
+import math
+from dataclasses import dataclass
+from typing import List, Optional
+
+from aoc2020.benchmark.history import BenchmarkHistory, HistoryRecord
+
+# Heap growth below this many bytes is never reported as a regression
+MEMORY_NOISE_FLOOR = 64 * 1024
+# Default slowdown of the median below which timing jitter is assumed
+TIME_NOISE_FLOOR_US = 50.
+
+
+@dataclass
+class Comparison:
+    base: HistoryRecord
+    head: HistoryRecord
+    threshold: float
+    noise_factor: float
+    min_delta_us: float = TIME_NOISE_FLOOR_US
+
+    @property
+    def day(self) -> int:
+        return self.head.day
+
+    @property
+    def part(self) -> int:
+        return self.head.part
+
+    @property
+    def change(self) -> float:
+        # Relative change of the median, positive means slower
+        if self.base.stats.median <= 0:
+            return 0.
+        return self.head.stats.median / self.base.stats.median - 1.
+
+    @property
+    def noise(self) -> float:
+        # Combined spread of both measurements, in nanoseconds
+        return math.hypot(self.base.stats.stddev, self.head.stats.stddev)
+
+    @property
+    def memory_change(self) -> Optional[float]:
+        # Relative change of the heap high-water mark, if measured for both
+        if not self.base.peak_heap or self.head.peak_heap is None:
+            return None
+        return self.head.peak_heap / self.base.peak_heap - 1.
+
+    @property
+    def time_regression(self) -> bool:
+        difference = self.head.stats.median - self.base.stats.median
+        return (
+            self.change > self.threshold
+            and difference > self.noise_factor * self.noise
+            and difference > self.min_delta_us * 1000.
+        )
+
+    @property
+    def memory_regression(self) -> bool:
+        # Heap usage is deterministic enough to only apply the threshold
+        change = self.memory_change
+        if change is None:
+            return False
+        difference = self.head.peak_heap - self.base.peak_heap  # type: ignore
+        return change > self.threshold and difference > MEMORY_NOISE_FLOOR
+
+    @property
+    def regression(self) -> bool:
+        return self.time_regression or self.memory_regression
+
+
+def compare_revisions(
+    history: BenchmarkHistory,
+    base: str,
+    head: str,
+    threshold: float = 0.05,
+    noise_factor: float = 2.,
+    min_delta_us: float = TIME_NOISE_FLOOR_US,
+) -> List[Comparison]:
+    base_records = history.load(revision=base)
+    head_records = history.load(revision=head)
+    comparisons: List[Comparison] = []
+    # Only targets measured on the same input in both revisions are compared
+    for key in sorted(set(base_records) & set(head_records)):
+        comparisons.append(
+            Comparison(
+                base=base_records[key],
+                head=head_records[key],
+                threshold=threshold,
+                noise_factor=noise_factor,
+                min_delta_us=min_delta_us,
+            )
+        )
+    return comparisons
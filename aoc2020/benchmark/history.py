@@ -0,0 +1,115 @@
+import json
+import logging
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aoc2020.benchmark.bench import PartBenchmark
+from aoc2020.benchmark.stats import TimingStats
+from aoc2020.utils.paths import get_cache_dir
+
+logger = logging.getLogger("BenchmarkHistory")
+
+# Day, part and input hash uniquely identify a measured target
+HistoryKey = Tuple[int, int, str]
+# Marks revisions measured with uncommitted changes
+DIRTY_SUFFIX = "-dirty"
+
+
+@dataclass
+class HistoryRecord:
+    revision: str
+    day: int
+    part: int
+    input_hash: str
+    samples_ns: List[int]
+    timestamp: float
+    peak_rss: Optional[int] = None
+    peak_heap: Optional[int] = None
+
+    @property
+    def key(self) -> HistoryKey:
+        return self.day, self.part, self.input_hash
+
+    @property
+    def stats(self) -> TimingStats:
+        return TimingStats(samples_ns=self.samples_ns)
+
+
+def current_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            check=True, universal_newlines=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            check=True, universal_newlines=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        logger.warning(f"Could not determine the git revision")
+        return "unknown"
+    # Uncommitted changes should not be attributed to the commit itself
+    return f"{revision}{DIRTY_SUFFIX}" if len(status) > 0 else revision
+
+
+def split_revision(revision: str) -> Tuple[str, bool]:
+    """Split a revision into its commit and whether it was dirty"""
+    if revision.endswith(DIRTY_SUFFIX):
+        return revision[:-len(DIRTY_SUFFIX)], True
+    return revision, False
+
+
+class BenchmarkHistory:
+    """Append-only JSONL log of benchmark results"""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = get_cache_dir() / "bench_history.jsonl"
+        self._path = path
+
+    def append(self, revision: str, results: Iterable[PartBenchmark]) -> None:
+        now = time.time()
+        with self._path.open(mode="a") as f:
+            for res in results:
+                record = HistoryRecord(
+                    revision=revision,
+                    day=res.day,
+                    part=res.part,
+                    input_hash=res.input_hash,
+                    samples_ns=res.stats.samples_ns,
+                    timestamp=now,
+                    peak_rss=res.memory.peak_rss if res.memory else None,
+                    peak_heap=res.memory.peak_heap if res.memory else None,
+                )
+                f.write(json.dumps(asdict(record)) + "\n")
+
+    def records(self) -> List[HistoryRecord]:
+        records: List[HistoryRecord] = []
+        if not self._path.is_file():
+            return records
+        with self._path.open(mode="r") as f:
+            for line in f:
+                line = line.strip()
+                if len(line) == 0:
+                    continue
+                try:
+                    records.append(HistoryRecord(**json.loads(line)))
+                except (ValueError, TypeError):
+                    logger.warning(f"Skipping invalid history line {line}")
+        return records
+
+    def load(self, revision: str) -> Dict[HistoryKey, HistoryRecord]:
+        # Revisions can be abbreviated, the latest record per key wins. A
+        # clean revision never matches runs with uncommitted changes on top.
+        commit, dirty = split_revision(revision)
+        latest: Dict[HistoryKey, HistoryRecord] = {}
+        for record in self.records():
+            record_commit, record_dirty = split_revision(record.revision)
+            if record_dirty == dirty and record_commit.startswith(commit):
+                latest[record.key] = record
+        return latest
@@ -0,0 +1,103 @@
+import argparse
+import json
+import subprocess
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+from aoc2020.utils.system import max_rss, peak_rss, reset_peak_rss
+
+PHASES: List[str] = ["parse", "solve_1", "solve_2", "solve_both"]
+
+
+@dataclass
+class MemoryUsage:
+    phase: str
+    # Resident set high-water mark of the phase in bytes, of the whole
+    # process where it cannot be reset (anything but Linux)
+    peak_rss: int
+    peak_heap: int  # Python heap high-water mark of the phase in bytes
+
+
+def _measure_phase(day: int, phase: str, demo: bool) -> MemoryUsage:
+    from aoc2020.data import DataFactory
+    from aoc2020.solvers import SolverFactory
+
+    if demo:
+        input_file = DataFactory.get_demo_file(day=day)
+    else:
+        input_file = DataFactory.get_input_file(day=day)
+
+    # Solver modules are imported on first use, that is not parsing
+    solver_class = SolverFactory.get_solver_class(day=day)
+    if phase == "parse":
+        measured = reset_peak_rss()
+        tracemalloc.start()
+        solver_class(input_file=input_file)
+    else:
+        solver = solver_class(input_file=input_file)
+        measured = reset_peak_rss()
+        tracemalloc.start()
+        getattr(solver, phase)()
+    _, peak_heap = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak = peak_rss() if measured else None
+    return MemoryUsage(
+        phase=phase,
+        peak_rss=peak if peak is not None else max_rss(),
+        peak_heap=peak_heap,
+    )
+
+
+def measure_memory(day: int, phase: str, demo: bool = False) -> MemoryUsage:
+    # A fresh process per phase, so high-water marks don't carry over
+    cmd = [
+        sys.executable, "-c", "from aoc2020.benchmark.memory import main; main()",
+        str(day), phase,
+    ]
+    if demo:
+        cmd.append("--demo")
+    proc = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"Memory measurement of day {day} {phase} failed:\n{proc.stderr}"
+        )
+    return MemoryUsage(**json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def day_phases(day: int) -> List[str]:
+    # The phases benchmarked for the day, fused solvers solve both at once
+    from aoc2020.solvers import SolverFactory
+
+    if SolverFactory.get_solver_class(day=day).fuses_parts():
+        return ["parse", "solve_both"]
+    return ["parse", "solve_1", "solve_2"]
+
+
+def measure_day_memory(day: int, demo: bool = False) -> Dict[str, MemoryUsage]:
+    return {
+        phase: measure_memory(day=day, phase=phase, demo=demo)
+        for phase in day_phases(day)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the memory usage of one solver phase"
+    )
+    parser.add_argument("day", type=int, help="Day of puzzle")
+    parser.add_argument("phase", choices=PHASES, help="Phase to measure")
+    parser.add_argument(
+        "-d", "--demo", help="Measure on demo input", action="store_true"
+    )
+    args = parser.parse_args()
+    usage = _measure_phase(day=args.day, phase=args.phase, demo=args.demo)
+    print(json.dumps(asdict(usage)))
+
+
+if __name__ == "__main__":
+    main()
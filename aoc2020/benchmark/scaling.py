@@ -0,0 +1,175 @@
+import logging
+import math
+import random
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from aoc2020.solvers import PuzzleSolver, SolverFactory
+
+logger = logging.getLogger("Scaling")
+
+# Candidate orders of growth, ordered from best to worst
+COMPLEXITIES: List[Tuple[str, Callable[[float], float]]] = [
+    ("O(1)", lambda n: 1.),
+    ("O(log n)", lambda n: math.log(n)),
+    ("O(n)", lambda n: n),
+    ("O(n log n)", lambda n: n * math.log(n)),
+    ("O(n^2)", lambda n: n ** 2),
+    ("O(n^3)", lambda n: n ** 3),
+]
+LINEAR_RANK = 2
+
+
+@dataclass
+class ScalingTarget:
+    name: str
+    day: int
+    # Generates the content of an input file of (roughly) size n
+    generate: Callable[[int, random.Random], str]
+    # Runs the measured function on a constructed solver
+    run: Callable[[PuzzleSolver], Any]
+    sizes: List[int]
+
+
+@dataclass
+class ScalingPoint:
+    size: int
+    duration: float  # In seconds
+    peak_memory: int  # In bytes
+
+
+@dataclass
+class ScalingResult:
+    target: str
+    points: List[ScalingPoint] = field(default_factory=list)
+
+    @property
+    def exponent(self) -> float:
+        """Slope of the log-log fit of duration against input size"""
+        xs = [math.log(p.size) for p in self.points]
+        ys = [math.log(max(p.duration, 1e-9)) for p in self.points]
+        x_mean = sum(xs) / len(xs)
+        y_mean = sum(ys) / len(ys)
+        num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+        den = sum((x - x_mean) ** 2 for x in xs)
+        return num / den if den > 0 else 0.
+
+    @property
+    def complexity(self) -> str:
+        return COMPLEXITIES[self._best_rank()][0]
+
+    @property
+    def superlinear(self) -> bool:
+        return self._best_rank() > LINEAR_RANK
+
+    def _best_rank(self) -> int:
+        # Least squares fit of duration = c * f(n) in log space
+        best_rank, best_error = 0, float("inf")
+        for rank, (_, fn) in enumerate(COMPLEXITIES):
+            residuals = [
+                math.log(max(p.duration, 1e-9)) - math.log(max(fn(p.size), 1e-9))
+                for p in self.points
+            ]
+            offset = sum(residuals) / len(residuals)
+            error = sum((r - offset) ** 2 for r in residuals)
+            if error < best_error:
+                best_rank, best_error = rank, error
+        return best_rank
+
+
+def _generate_day1(n: int, rng: random.Random) -> str:
+    # Large values never sum to 2020, the triplet is placed last
+    values = rng.sample(range(2021, 10 * n + 2021), n - 3) + [500, 600, 920]
+    return "\n".join(map(str, values))
+
+
+def _generate_day9(n: int, rng: random.Random) -> str:
+    # A period of 25 values containing two zeros keeps every value a sum of
+    #  two previous ones. The final value is the sum of the last half of the
+    #  values, with a run length that is no multiple of the period.
+    period = [0, 0] + [rng.randint(1, 100) for _ in range(23)]
+    values = [period[i % len(period)] for i in range(n)]
+    run_length = n // 2 + 7 if (n // 2) % 25 == 0 else n // 2
+    values.append(sum(values[-run_length:]))
+    return "\n".join(map(str, values))
+
+
+def _generate_day7(n: int, rng: random.Random) -> str:
+    # Binary tree of bags that does not contain a shiny gold bag
+    lines = []
+    for i in range(n):
+        children = [c for c in (2 * i + 1, 2 * i + 2) if c < n]
+        if len(children) == 0:
+            lines.append(f"plain b{i} bags contain no other bags.")
+        else:
+            content = ", ".join(
+                f"{rng.randint(1, 5)} plain b{c} bags" for c in children
+            )
+            lines.append(f"plain b{i} bags contain {content}.")
+    return "\n".join(lines)
+
+
+SCALING_TARGETS: Dict[str, ScalingTarget] = {
+    target.name: target for target in [
+        ScalingTarget(
+            name="SolverDay1.solve_2",
+            day=1,
+            generate=_generate_day1,
+            run=lambda solver: solver.solve_2(),
+            sizes=[50, 100, 200, 400, 800],
+        ),
+        ScalingTarget(
+            name="SolverDay9.solve_2",
+            day=9,
+            generate=_generate_day9,
+            run=lambda solver: solver.solve_2(),
+            sizes=[100, 200, 400, 800, 1600],
+        ),
+        ScalingTarget(
+            name="SolverDay7._can_contain",
+            day=7,
+            generate=_generate_day7,
+            run=lambda solver: solver._can_contain(  # type: ignore
+                bag="plain b0", content="shiny gold"
+            ),
+            sizes=[250, 500, 1000, 2000, 4000],
+        ),
+    ]
+}
+
+
+def measure_scaling(
+    target: ScalingTarget, repeats: int = 3, seed: int = 2020
+) -> ScalingResult:
+    rng = random.Random(seed)
+    result = ScalingResult(target=target.name)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in target.sizes:
+            input_file = Path(tmp_dir) / f"day{target.day}_{size}.txt"
+            input_file.write_text(target.generate(size, rng))
+            solver = SolverFactory.create_solver(
+                day=target.day, input_file=input_file
+            )
+            # Timing and memory are measured separately, tracing is slow
+            durations: List[float] = []
+            for _ in range(repeats):
+                solver.reset_steps()
+                a = time.perf_counter()
+                target.run(solver)
+                durations.append(time.perf_counter() - a)
+            solver.reset_steps()
+            tracemalloc.start()
+            try:
+                target.run(solver)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            logger.debug(f"{target.name} n={size}: {min(durations):.4f}s")
+            result.points.append(
+                ScalingPoint(size=size, duration=min(durations), peak_memory=peak)
+            )
+    return result
@@ -0,0 +1,34 @@
+import math
+import statistics
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class TimingStats:
+    samples_ns: List[int]
+
+    @property
+    def min(self) -> float:
+        return float(min(self.samples_ns))
+
+    @property
+    def median(self) -> float:
+        return float(statistics.median(self.samples_ns))
+
+    @property
+    def mean(self) -> float:
+        return float(statistics.mean(self.samples_ns))
+
+    @property
+    def p95(self) -> float:
+        # Nearest-rank percentile, no interpolation
+        ordered = sorted(self.samples_ns)
+        rank = max(1, math.ceil(0.95 * len(ordered)))
+        return float(ordered[rank - 1])
+
+    @property
+    def stddev(self) -> float:
+        if len(self.samples_ns) < 2:
+            return 0.
+        return float(statistics.stdev(self.samples_ns))
@@ -1,15 +1,26 @@
-import pkg_resources
 from pathlib import Path
 
+from aoc2020.utils.resources import read_resource, resource_path
+
 
 class DataFactory:
 
     @classmethod
     def get_demo_file(cls, day: int) -> Path:
         target = f"demo_files/day{day}.txt"
-        return Path(pkg_resources.resource_filename(__package__, target))
+        return resource_path(__package__, target)
 
     @classmethod
     def get_input_file(cls, day: int) -> Path:
         target = f"input_files/day{day}.txt"
-        return Path(pkg_resources.resource_filename(__package__, target))
+        return resource_path(__package__, target)
+
+    @classmethod
+    def read_demo_file(cls, day: int) -> bytes:
+        target = f"demo_files/day{day}.txt"
+        return read_resource(__package__, target)
+
+    @classmethod
+    def read_input_file(cls, day: int) -> bytes:
+        target = f"input_files/day{day}.txt"
+        return read_resource(__package__, target)
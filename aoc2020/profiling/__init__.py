@@ -0,0 +1,30 @@
+from .allocations import (
+    AllocationSite,
+    AllocationTracer,
+    PhaseAllocations,
+    format_allocations,
+)
+from .cprofiler import CProfiler, format_stats, profile_label
+from .imports import (
+    ImportRecord,
+    format_import_table,
+    profile_imports,
+    write_import_profile,
+)
+from .sampler import StackSampler, count_samples
+
+__all__ = [
+    "AllocationSite",
+    "AllocationTracer",
+    "CProfiler",
+    "ImportRecord",
+    "PhaseAllocations",
+    "StackSampler",
+    "count_samples",
+    "format_allocations",
+    "format_import_table",
+    "format_stats",
+    "profile_imports",
+    "profile_label",
+    "write_import_profile",
+]
@@ -0,0 +1,139 @@
+import threading
+import tracemalloc
+import _weakrefset
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Allocations of the tracer itself are not attributed to the solver
+_IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, _weakrefset.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclass
+class AllocationSite:
+    filename: str
+    lineno: int
+    size: int  # Bytes
+    count: int  # Memory blocks
+
+
+@dataclass
+class PhaseAllocations:
+    peak: int  # High-water mark of the phase in bytes
+    retained: int  # Still allocated at the end of the phase, in bytes
+    snapshot_size: int  # Bytes traced in the snapshot the sites come from
+    by_size: List[AllocationSite] = field(default_factory=list)
+    by_count: List[AllocationSite] = field(default_factory=list)
+
+
+class AllocationTracer:
+    """Attributes the memory of a solver phase to source lines
+
+    Most solvers free their working set before returning, so a snapshot at
+    the end of a phase says little about its peak. A watcher thread takes a
+    new snapshot whenever the traced memory grew by `growth` since the last
+    one, the largest snapshot is reported.
+    """
+
+    def __init__(
+        self, top: int = 10, interval: float = 0.05, growth: float = 0.2
+    ):
+        self.top = top
+        self.interval = interval  # Seconds between checks of the watcher
+        self.growth = growth
+
+    def _watch(
+        self, stop: threading.Event, largest: List[tracemalloc.Snapshot]
+    ) -> None:
+        size = 0
+        while not stop.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > size * (1. + self.growth):
+                largest[:] = [tracemalloc.take_snapshot()]
+                size, _ = tracemalloc.get_traced_memory()
+
+    def _sites(self, snapshot: tracemalloc.Snapshot) -> List[AllocationSite]:
+        stats = snapshot.filter_traces(_IGNORED).statistics("lineno")
+        return [
+            AllocationSite(
+                filename=stat.traceback[0].filename,
+                lineno=stat.traceback[0].lineno,
+                size=stat.size,
+                count=stat.count,
+            )
+            for stat in stats
+        ]
+
+    def trace(self, fn: Callable[[], T]) -> Tuple[T, PhaseAllocations]:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            # Before Python 3.9 only restarting resets the peak
+            limit = tracemalloc.get_traceback_limit()
+            tracemalloc.stop()
+            tracemalloc.start(limit)
+        baseline, _ = tracemalloc.get_traced_memory()
+        stop = threading.Event()
+        largest: List[tracemalloc.Snapshot] = []
+        watcher = threading.Thread(
+            target=self._watch, args=(stop, largest), daemon=True
+        )
+        watcher.start()
+        try:
+            value = fn()
+        finally:
+            stop.set()
+            watcher.join()
+        retained, peak = tracemalloc.get_traced_memory()
+        final = tracemalloc.take_snapshot()
+        if started:
+            tracemalloc.stop()
+
+        sites = self._sites(final)
+        if len(largest) > 0:
+            candidate = self._sites(largest[0])
+            if sum(s.size for s in candidate) > sum(s.size for s in sites):
+                sites = candidate
+        allocations = PhaseAllocations(
+            peak=peak - baseline,
+            retained=retained - baseline,
+            snapshot_size=sum(site.size for site in sites),
+            by_size=sites[:self.top],
+            by_count=sorted(sites, key=lambda s: s.count, reverse=True)[
+                :self.top
+            ],
+        )
+        return value, allocations
+
+
+def _format_site(site: AllocationSite) -> str:
+    return (
+        f"{site.size/1024:>12.1f} {site.count:>10}  "
+        f"{site.filename}:{site.lineno}"
+    )
+
+
+def format_allocations(
+    allocations: PhaseAllocations, top: Optional[int] = None
+) -> str:
+    lines = [
+        f"peak {allocations.peak/1024:.1f} KiB, "
+        f"retained {allocations.retained/1024:.1f} KiB, "
+        f"sites from a snapshot of {allocations.snapshot_size/1024:.1f} KiB"
+    ]
+    for title, sites in [
+        ("size", allocations.by_size), ("count", allocations.by_count)
+    ]:
+        lines.append(f"Top allocation sites by {title}")
+        lines.append(f"{'KiB':>12} {'blocks':>10}  site")
+        lines.extend(_format_site(site) for site in sites[:top])
+    return "\n".join(lines)
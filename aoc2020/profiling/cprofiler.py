@@ -0,0 +1,45 @@
+import cProfile
+import io
+import pstats
+from pathlib import Path
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def profile_label(day: Optional[int], is_test: bool, phase: str) -> str:
+    kind = "demo" if is_test else "input"
+    return f"day{day}_{kind}_{phase}"
+
+
+class CProfiler:
+    """Runs solver phases under cProfile, one pstats file per phase"""
+
+    def __init__(self, output_dir: Path, top: int = 15):
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+        self.top = top
+        # Only filled in the process that did the profiling
+        self.written: List[Path] = []
+
+    def stats_file(self, label: str) -> Path:
+        return self.output_dir / f"{label}.pstats"
+
+    def profile(self, label: str, fn: Callable[[], T]) -> T:
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            return fn()
+        finally:
+            profile.disable()
+            profile.dump_stats(str(self.stats_file(label)))
+            self.written.append(self.stats_file(label))
+
+
+def format_stats(stats_file: Path, top: int) -> str:
+    output = io.StringIO()
+    for sort_key, title in [("cumulative", "cumulative"), ("tottime", "self")]:
+        output.write(f"Top {top} functions by {title} time\n")
+        stats = pstats.Stats(str(stats_file), stream=output)
+        stats.strip_dirs().sort_stats(sort_key).print_stats(top)
+    return output.getvalue()
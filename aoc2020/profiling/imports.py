@@ -0,0 +1,104 @@
+import json
+import logging
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List
+
+logger = logging.getLogger("ImportProfiler")
+
+# Mimics the CLI until right before the first solver part is run
+_CHILD_CODE = """
+import aoc2020.solve
+from aoc2020.data import DataFactory
+from aoc2020.solvers import SolverFactory
+SolverFactory.create_solver(day={day}, input_file=DataFactory.get_demo_file(day={day}))
+"""
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    records: List[ImportRecord] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            # Header line
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(stripped)) // 2
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=depth,
+            )
+        )
+    return records
+
+
+def profile_imports(day: int) -> List[ImportRecord]:
+    # A fresh interpreter is needed, modules imported here are cached
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_CODE.format(day=day)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Import profiling failed:\n{proc.stderr}")
+    return parse_importtime(proc.stderr)
+
+
+def total_import_time(records: List[ImportRecord]) -> int:
+    return sum(r.cumulative_us for r in records if r.depth == 0)
+
+
+def format_import_table(records: List[ImportRecord], top: int = 20) -> str:
+    lines = [f"Total import time: {total_import_time(records)/1000:.1f}ms"]
+    rankings = [
+        ("cumulative", lambda r: r.cumulative_us),
+        ("self", lambda r: r.self_us),
+    ]
+    for title, key in rankings:
+        lines.append("")
+        lines.append(f"Top {top} modules by {title} time")
+        lines.append(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for rec in sorted(records, key=key, reverse=True)[:top]:
+            lines.append(
+                f"{rec.self_us/1000:>9.2f} {rec.cumulative_us/1000:>9.2f}  "
+                f"{rec.module}"
+            )
+    return "\n".join(lines)
+
+
+def write_import_profile(
+    records: List[ImportRecord], day: int, path: Path
+) -> None:
+    artifact = {
+        "day": day,
+        "python": platform.python_version(),
+        "total_us": total_import_time(records),
+        "modules": [asdict(rec) for rec in records],
+    }
+    with path.open(mode="w") as f:
+        json.dump(artifact, f, indent=2)
+    logger.info(f"Import profile written to {path}")
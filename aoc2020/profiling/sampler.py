@@ -0,0 +1,75 @@
+import os
+import signal
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Stack = Tuple[str, ...]
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{name}"
+
+
+class StackSampler:
+    """Statistical profiler sampling the Python stack on SIGPROF
+
+    The interval timer counts CPU time of the process, the handler runs in
+    the main thread between bytecodes and only counts the stack it finds.
+    Stacks are written in the collapsed format of flamegraph.pl, speedscope
+    and similar tools, one file per phase.
+    """
+
+    def __init__(self, output_dir: Path, rate: float = 1000.):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError(f"Sampling needs signal.setitimer (Unix only)")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+        self.rate = rate  # Samples per second of CPU time
+        self._samples: Counter = Counter()
+        self._root: Optional[FrameType] = None
+
+    def stacks_file(self, label: str) -> Path:
+        return self.output_dir / f"{label}.folded"
+
+    def _handle(self, signum: int, frame: Optional[FrameType]) -> None:
+        names: List[str] = []
+        # Frames up to the sampler itself belong to the runner
+        while frame is not None and frame is not self._root:
+            names.append(_frame_name(frame))
+            frame = frame.f_back
+        self._samples[tuple(reversed(names))] += 1
+
+    def profile(self, label: str, fn: Callable[[], T]) -> T:
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError(f"Signals are only delivered to the main thread")
+        self._samples = Counter()
+        self._root = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self._handle)
+        interval = 1. / self.rate
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        try:
+            return fn()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            self._root = None
+            self._write(self.stacks_file(label))
+
+    def _write(self, path: Path) -> None:
+        with path.open(mode="w") as f:
+            for stack, count in sorted(self._samples.items()):
+                if len(stack) > 0:
+                    f.write(f"{';'.join(stack)} {count}\n")
+
+
+def count_samples(path: Path) -> int:
+    with path.open() as f:
+        return sum(int(line.rsplit(" ", 1)[1]) for line in f if line.strip())
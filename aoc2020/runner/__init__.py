@@ -0,0 +1,57 @@
+from .execution import (
+    build_solver,
+    format_phases,
+    log_day_result,
+    log_solver_result,
+    run_day,
+    run_solver,
+)
+from .instruments import Instruments
+from .orchestrator import (
+    ConcurrencyLimits,
+    DayInputs,
+    resolve_inputs,
+    run_streaming,
+    stream_days,
+)
+from .parallel import run_parallel
+from .result_cache import ResultCache
+from .results import DayResult, PartResult, SolverResult, write_results
+from .sandbox import (
+    SandboxLimits,
+    SandboxOutcome,
+    run_sandboxed,
+    run_sandboxed_all,
+)
+from .scheduling import TimingHistory, parse_days
+from .telemetry import TelemetryRecord, TelemetryWriter, day_records
+
+__all__ = [
+    "ConcurrencyLimits",
+    "DayInputs",
+    "DayResult",
+    "Instruments",
+    "PartResult",
+    "ResultCache",
+    "SandboxLimits",
+    "SandboxOutcome",
+    "SolverResult",
+    "TelemetryRecord",
+    "TelemetryWriter",
+    "TimingHistory",
+    "build_solver",
+    "day_records",
+    "format_phases",
+    "log_day_result",
+    "log_solver_result",
+    "parse_days",
+    "resolve_inputs",
+    "run_day",
+    "run_parallel",
+    "run_sandboxed",
+    "run_sandboxed_all",
+    "run_solver",
+    "run_streaming",
+    "stream_days",
+    "write_results",
+]
@@ -0,0 +1,356 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aoc2020.data import DataFactory
+from aoc2020.runner.instruments import Instruments
+from aoc2020.runner.result_cache import ResultCache
+from aoc2020.runner.results import DayResult, PartResult, SolverResult
+from aoc2020.runner.sandbox import (
+    OK,
+    SandboxLimits,
+    SandboxOutcome,
+    run_sandboxed,
+    run_sandboxed_all,
+)
+from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers.metrics import format_metrics
+from aoc2020.utils.system import peak_rss, reset_peak_rss
+
+logger = logging.getLogger("AoCRunner")
+
+PART_NAMES = {1: "one", 2: "two"}
+
+
+def build_solver(
+    day: int,
+    input_file: Path,
+    instruments: Optional[Instruments] = None,
+    result: Optional[SolverResult] = None,
+) -> Tuple[PuzzleSolver, Dict[str, float]]:
+    # Importing only costs time the first time a day is used in a process
+    a = time.perf_counter()
+    solver_class = SolverFactory.get_solver_class(day=day)
+    b = time.perf_counter()
+    cpu = time.process_time()
+    measured = reset_peak_rss()
+    if instruments is not None and result is not None:
+        # Construction runs _read_file, instrumented apart from the parts
+        solver = instruments.run(
+            lambda: solver_class(input_file=input_file),
+            day=day,
+            phase="construct",
+            result=result,
+        )
+    else:
+        solver = solver_class(input_file=input_file)
+    c = time.perf_counter()
+    if result is not None:
+        result.cpu["construct"] = time.process_time() - cpu
+        peak = peak_rss() if measured else None
+        if peak is not None:
+            result.peak_rss["construct"] = peak
+    phases = {
+        "import": b-a,
+        "construct": c-b,  # Includes parsing
+        "parse": solver.parse_duration,
+    }
+    return solver, phases
+
+
+SolveJob = Callable[[], Tuple[Any, Dict[str, float], float, Optional[int]]]
+
+
+def _solve_job(
+    solver: PuzzleSolver,
+    fn: Callable[[], Any],
+    phase: str,
+    day: Optional[int],
+    result: SolverResult,
+    instruments: Instruments,
+) -> SolveJob:
+    def solve() -> Tuple[Any, Dict[str, float], float, Optional[int]]:
+        # Runs in a forked child if there is one, so measure in there
+        cpu = time.process_time()
+        measured = reset_peak_rss()
+        value = instruments.run(fn, day=day, phase=phase, result=result)
+        cpu = time.process_time() - cpu
+        peak = peak_rss() if measured else None
+        return value, solver.metrics.snapshot(), cpu, peak
+
+    return solve
+
+
+def _run_job(
+    solver: PuzzleSolver, job: SolveJob, limits: Optional[SandboxLimits]
+) -> SandboxOutcome:
+    a = time.perf_counter()
+    if limits is None:
+        outcome = SandboxOutcome(status=OK, value=job())
+    else:
+        outcome = run_sandboxed(job, limits)
+    outcome.duration = time.perf_counter() - a
+    solver.metrics.reset()
+    return outcome
+
+
+def _record_phase(
+    outcome: SandboxOutcome, phase: str, result: SolverResult
+) -> Dict[str, float]:
+    result.phases[phase] = outcome.duration
+    metrics: Dict[str, float] = {}
+    if outcome.status == OK:
+        outcome.value, metrics, cpu, peak = outcome.value
+        result.cpu[phase] = cpu
+        if peak is not None:
+            result.peak_rss[phase] = peak
+    return metrics
+
+
+def run_solver(
+    solver: PuzzleSolver,
+    is_test: bool,
+    day: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    phases: Optional[Dict[str, float]] = None,
+    instruments: Optional[Instruments] = None,
+    result: Optional[SolverResult] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+) -> SolverResult:
+    # The result may already hold what was collected during construction
+    if result is None:
+        result = SolverResult(is_test=is_test)
+    result.phases.update(phases or {})
+    result.input_size = solver._input_file.stat().st_size
+    if instruments is None:
+        instruments = Instruments()
+    solve_fns = {1: solver.solve_1, 2: solver.solve_2}
+    expected = {1: solver.demo_result_1, 2: solver.demo_result_2}
+    keys: Dict[int, Optional[str]] = {part: None for part in solve_fns}
+    part_results: Dict[int, Optional[PartResult]] = {
+        part: None for part in solve_fns
+    }
+    if cache is not None and day is not None:
+        for part in solve_fns:
+            keys[part] = cache.key(solver=solver, day=day, part=part)
+            part_results[part] = cache.load(keys[part])
+
+    missing = [part for part, res in part_results.items() if res is None]
+    # Only count what happens while solving
+    solver.metrics.reset()
+    if len(missing) == len(solve_fns) and solver.fuses_parts():
+        # Both parts are answered in a single pass, they share the duration
+        job = _solve_job(
+            solver, solver.solve_both, "solve_both", day, result, instruments
+        )
+        outcome = _run_job(solver, job, limits)
+        metrics = _record_phase(outcome, "solve_both", result)
+        solutions = outcome.value if outcome.status == OK else (None, None)
+        for part, solution in zip(sorted(solve_fns), solutions):
+            part_results[part] = PartResult(
+                part=part,
+                solution=solution,
+                duration=outcome.duration,
+                fused=True,
+                metrics=metrics,
+                status=outcome.status,
+                detail=outcome.detail,
+            )
+    else:
+        jobs = {
+            part: _solve_job(
+                solver, solve_fns[part], f"solve_{part}", day, result,
+                instruments,
+            )
+            for part in missing
+        }
+        concurrent = (
+            fork_parts and len(missing) > 1 and solver.independent_parts
+        )
+        if concurrent:
+            # Parsed once, each part mutates only its own forked copy
+            outcomes = run_sandboxed_all(
+                [jobs[part] for part in missing], limits or SandboxLimits()
+            )
+        else:
+            outcomes = [
+                _run_job(solver, jobs[part], limits) for part in missing
+            ]
+        for part, outcome in zip(missing, outcomes):
+            metrics = _record_phase(outcome, f"solve_{part}", result)
+            part_results[part] = PartResult(
+                part=part,
+                solution=outcome.value,
+                duration=outcome.duration,
+                concurrent=concurrent,
+                metrics=metrics,
+                status=outcome.status,
+                detail=outcome.detail,
+            )
+
+    for part in sorted(solve_fns):
+        part_result = part_results[part]
+        assert part_result is not None
+        if cache is not None and part in missing and part_result.status == OK:
+            cache.store(keys[part], part_result)
+        if is_test:
+            part_result.expected = expected[part]
+        result.parts.append(part_result)
+    for name, stats in solver.step_stats.items():
+        logger.debug(
+            f"Cached step {name}: {stats.hits} hits, {stats.misses} misses"
+        )
+    return result
+
+
+def log_solver_result(
+    result: SolverResult, profile_top: Optional[int] = None
+) -> None:
+    correct = True
+    for part in result.parts:
+        name = PART_NAMES.get(part.part, str(part.part))
+        if part.status != OK:
+            logger.error(
+                f"[Part {name}]: {part.status} after "
+                f"{part.duration*1000.:.2f}ms ({part.detail})"
+            )
+            correct = False
+        elif result.is_test:
+            if part.expected is None:
+                logger.warning(f"No demo result available for part {name}")
+            elif not part.correct:
+                logger.error(
+                    f"[Part {name}] Expected result {part.expected}, "
+                    f"got {part.solution}."
+                )
+                correct = False
+        elif part.cached:
+            logger.info(
+                f"[Part {name}]: Solution is {part.solution} "
+                f"(from cache, originally solved in "
+                f"{part.duration*1000.:.2f}ms)"
+            )
+        elif part.concurrent:
+            logger.info(
+                f"[Part {name}]: Solution is {part.solution} "
+                f"(solved in {part.duration*1000.:.2f}ms, concurrently with "
+                f"the other part)"
+            )
+        elif part.fused:
+            logger.info(
+                f"[Part {name}]: Solution is {part.solution} "
+                f"(both parts solved in a single pass in "
+                f"{part.duration*1000.:.2f}ms)"
+            )
+        else:
+            logger.info(
+                f"[Part {name}]: Solution is {part.solution} "
+                f"(solved in {part.duration*1000.:.2f}ms)"
+            )
+        if len(part.metrics) > 0:
+            logger.info(f"[Part {name}] metrics: {format_metrics(part.metrics)}")
+
+    if result.is_test and correct:
+        logger.info(f"Congrats, both demo parts verified correctly!")
+    if len(result.phases) > 0:
+        logger.info(f"[Phases]: {format_phases(result.phases)}")
+    if result.profiles or result.samples or result.allocations:
+        # Only instrumented runs pay for importing the profiling tools
+        from aoc2020.profiling import (
+            count_samples,
+            format_allocations,
+            format_stats,
+        )
+    for phase, stats_file in result.profiles.items():
+        logger.info(f"[Profile {phase}]: written to {stats_file}")
+        if profile_top is not None:
+            logger.info(f"\n{format_stats(Path(stats_file), top=profile_top)}")
+    for phase, stacks_file in result.samples.items():
+        logger.info(
+            f"[Samples {phase}]: {count_samples(Path(stacks_file))} stack "
+            f"samples written to {stacks_file}"
+        )
+    for phase, allocations in result.allocations.items():
+        logger.info(
+            f"[Allocations {phase}]: {format_allocations(allocations)}"
+        )
+
+
+def format_phases(phases: Dict[str, float]) -> str:
+    return ", ".join(
+        f"{name} {duration*1000.:.2f}ms" for name, duration in phases.items()
+    )
+
+
+def run_day(
+    day: int,
+    demo_only: bool,
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+    demo_file: Optional[Path] = None,
+    general_file: Optional[Path] = None,
+) -> DayResult:
+    # Files may be resolved up front, e.g. in the threads of the orchestrator
+    start = time.time()
+    demo = SolverResult(is_test=True)
+    if demo_file is None:
+        demo_file = DataFactory.get_demo_file(day=day)
+    demo_solver, phases = build_solver(
+        day=day, input_file=demo_file, instruments=instruments, result=demo
+    )
+    result = DayResult(
+        day=day,
+        demo=run_solver(
+            demo_solver,
+            is_test=True,
+            day=day,
+            cache=cache,
+            phases=phases,
+            instruments=instruments,
+            result=demo,
+            limits=limits,
+            fork_parts=fork_parts,
+        ),
+    )
+
+    if not demo_only:
+        general = SolverResult(is_test=False)
+        if general_file is None:
+            general_file = DataFactory.get_input_file(day=day)
+        general_solver, phases = build_solver(
+            day=day,
+            input_file=general_file,
+            instruments=instruments,
+            result=general,
+        )
+        result.general = run_solver(
+            general_solver,
+            is_test=False,
+            day=day,
+            cache=cache,
+            phases=phases,
+            instruments=instruments,
+            result=general,
+            limits=limits,
+            fork_parts=fork_parts,
+        )
+
+    result.duration = time.time() - start
+    return result
+
+
+def log_day_result(
+    result: DayResult, profile_top: Optional[int] = None
+) -> None:
+    logger.info(f"Day {result.day} (finished in {result.duration:.2f}s)")
+    logger.info(f"Running demo")
+    log_solver_result(result.demo, profile_top=profile_top)
+    logger.info(f"")
+    if result.general is not None:
+        logger.info(f"Running solver")
+        log_solver_result(result.general, profile_top=profile_top)
+        logger.info(f"")
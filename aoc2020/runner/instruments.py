@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from aoc2020.runner.results import SolverResult
+
+if TYPE_CHECKING:
+    from aoc2020.profiling import AllocationTracer, CProfiler, StackSampler
+
+T = TypeVar("T")
+
+
+@dataclass
+class Instruments:
+    """Optional tools run around each solver phase
+
+    Whatever they produce is stored on the SolverResult, so it also makes it
+    back from worker processes.
+    """
+    profiler: Optional["CProfiler"] = None
+    tracer: Optional["AllocationTracer"] = None
+    sampler: Optional["StackSampler"] = None
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            tool is not None
+            for tool in [self.profiler, self.tracer, self.sampler]
+        )
+
+    def run(
+        self,
+        fn: Callable[[], T],
+        day: Optional[int],
+        phase: str,
+        result: SolverResult,
+    ) -> T:
+        if not self.enabled:
+            return fn()
+        # Plain runs never pay for importing the profiling tools
+        from aoc2020.profiling import profile_label
+
+        label = profile_label(day, result.is_test, phase)
+        if self.profiler is not None:
+            result.profiles[phase] = str(self.profiler.stats_file(label))
+            fn = partial(self.profiler.profile, label, fn)
+        if self.sampler is not None:
+            result.samples[phase] = str(self.sampler.stacks_file(label))
+            fn = partial(self.sampler.profile, label, fn)
+        if self.tracer is not None:
+            value, result.allocations[phase] = self.tracer.trace(fn)
+            return value
+        return fn()
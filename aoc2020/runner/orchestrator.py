@@ -0,0 +1,172 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import AsyncIterator, Callable, List, Optional
+
+from aoc2020.data import DataFactory
+from aoc2020.runner.execution import run_day
+from aoc2020.runner.instruments import Instruments
+from aoc2020.runner.result_cache import ResultCache
+from aoc2020.runner.results import DayResult
+from aoc2020.runner.sandbox import SandboxLimits
+from aoc2020.runner.scheduling import TimingHistory
+
+logger = logging.getLogger("Orchestrator")
+
+
+@dataclass
+class ConcurrencyLimits:
+    jobs: Optional[int] = None  # Worker processes, defaults to the CPU count
+    io_workers: int = 4  # Threads resolving input files
+    prefetch: int = 2  # Days queued ahead of a free worker
+
+
+@dataclass
+class DayInputs:
+    day: int
+    demo_file: Path
+    input_file: Optional[Path]
+
+
+def resolve_inputs(day: int, demo_only: bool) -> DayInputs:
+    """Resolve the input files of a day to filesystem paths
+
+    Only zipped installs do I/O here, they extract the files to the cache
+    dir. Solvers open and parse the files themselves in the worker.
+    """
+    return DayInputs(
+        day=day,
+        demo_file=DataFactory.get_demo_file(day=day),
+        input_file=None if demo_only else DataFactory.get_input_file(day=day),
+    )
+
+
+def _worker_context() -> BaseContext:
+    """Start method of the worker processes
+
+    Solver options such as --param, metrics, tracing and the parse cache are
+    class attributes and module globals set in the parent. Forked workers
+    inherit them, spawned workers import the modules afresh and would run
+    with the defaults, as on macOS and Windows by default.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    logger.warning(
+        f"Workers cannot be forked, they run without the solver options"
+    )
+    return multiprocessing.get_context()
+
+
+async def stream_days(
+    days: List[int],
+    demo_only: bool,
+    concurrency: Optional[ConcurrencyLimits] = None,
+    history: Optional[TimingHistory] = None,
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+) -> AsyncIterator[DayResult]:
+    """Solve days in worker processes and yield results as they complete
+
+    Threads resolve the inputs of upcoming days while the workers compute,
+    parsing stays in the workers. At most `jobs + prefetch` days are
+    submitted and not yet solved, so a large batch never queues far ahead
+    of what the workers can take.
+    """
+    # Imported here, it would slow down the startup of every other run
+    import asyncio
+
+    if concurrency is None:
+        concurrency = ConcurrencyLimits()
+    if history is None:
+        history = TimingHistory()
+    jobs = concurrency.jobs or os.cpu_count() or 1
+    # Longest jobs first, so the batch ends close to the slowest single day
+    order = history.longest_first(days)
+    logger.debug(f"Scheduling order: {order}")
+    if len(order) == 0:
+        return
+    loop = asyncio.get_running_loop()
+    # Waiters acquire in order, so days are submitted in the scheduling order
+    slots = asyncio.Semaphore(jobs + concurrency.prefetch)
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency.io_workers, thread_name_prefix="aoc-io"
+    ) as io_pool, ProcessPoolExecutor(
+        max_workers=min(jobs, len(order)), mp_context=_worker_context()
+    ) as cpu_pool:
+
+        async def solve(day: int) -> Optional[DayResult]:
+            async with slots:
+                try:
+                    inputs = await loop.run_in_executor(
+                        io_pool, resolve_inputs, day, demo_only
+                    )
+                    return await loop.run_in_executor(
+                        cpu_pool, run_day, day, demo_only, cache,
+                        instruments, limits, fork_parts, inputs.demo_file,
+                        inputs.input_file,
+                    )
+                except Exception:
+                    logger.exception(f"Solving day {day} failed")
+                    return None
+
+        tasks = [asyncio.ensure_future(solve(day)) for day in order]
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                if result is None:
+                    continue
+                logger.debug(
+                    f"Day {result.day} finished in {result.duration:.2f}s"
+                )
+                # Cached days say nothing about how long solving takes
+                if not demo_only and not result.cached:
+                    history.record(day=result.day, duration=result.duration)
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    if not demo_only:
+        history.save()
+
+
+def run_streaming(
+    days: List[int],
+    demo_only: bool,
+    on_result: Optional[Callable[[DayResult], None]] = None,
+    concurrency: Optional[ConcurrencyLimits] = None,
+    history: Optional[TimingHistory] = None,
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+) -> List[DayResult]:
+    """Run stream_days to completion, handing each result to on_result"""
+    import asyncio
+
+    async def collect() -> List[DayResult]:
+        results = []
+        async for result in stream_days(
+            days=days,
+            demo_only=demo_only,
+            concurrency=concurrency,
+            history=history,
+            cache=cache,
+            instruments=instruments,
+            limits=limits,
+            fork_parts=fork_parts,
+        ):
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    results = asyncio.run(collect())
+    return sorted(results, key=lambda result: result.day)
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from aoc2020.runner.instruments import Instruments
+from aoc2020.runner.orchestrator import ConcurrencyLimits, run_streaming
+from aoc2020.runner.result_cache import ResultCache
+from aoc2020.runner.results import DayResult
+from aoc2020.runner.sandbox import SandboxLimits
+from aoc2020.runner.scheduling import TimingHistory
+
+
+def run_parallel(
+    days: List[int],
+    demo_only: bool,
+    jobs: Optional[int] = None,
+    history: Optional[TimingHistory] = None,
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+) -> List[DayResult]:
+    """Solve days in worker processes and return the results sorted by day
+
+    Scheduling is up to the orchestrator, results are only returned once
+    every day finished.
+    """
+    if len(days) == 0:
+        return []
+    return run_streaming(
+        days=days,
+        demo_only=demo_only,
+        concurrency=ConcurrencyLimits(jobs=jobs),
+        history=history,
+        cache=cache,
+        instruments=instruments,
+        limits=limits,
+        fork_parts=fork_parts,
+    )
@@ -0,0 +1,86 @@
+import hashlib
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+from aoc2020.runner.results import PartResult
+from aoc2020.solvers import PuzzleSolver
+from aoc2020.utils.hashing import hash_file
+from aoc2020.utils.paths import get_cache_dir
+
+logger = logging.getLogger("ResultCache")
+
+
+class ResultCache:
+    """Solutions keyed by day, part, input hash and solver source hash"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, read: bool = True):
+        if cache_dir is None:
+            cache_dir = get_cache_dir() / "results"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = cache_dir
+        # When not reading, every part is solved again and overwritten
+        self.read = read
+
+    @staticmethod
+    def key(solver: PuzzleSolver, day: int, part: int) -> Optional[str]:
+        try:
+            source_file = inspect.getsourcefile(type(solver))
+        except TypeError:
+            source_file = None
+        if source_file is None:
+            # Without source there is nothing to invalidate the entry on
+            return None
+        parts = [
+            str(day),
+            str(part),
+            hash_file(solver._input_file),
+            hash_file(Path(source_file)),
+        ]
+        # Answers depend on the problem size as well
+        parts.extend(
+            f"{name}={getattr(solver, name)}" for name in solver.parameters
+        )
+        return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+    def load(self, key: Optional[str]) -> Optional[PartResult]:
+        if key is None or not self.read:
+            return None
+        entry_file = self._cache_dir / f"{key}.json"
+        if not entry_file.is_file():
+            return None
+        try:
+            with entry_file.open(mode="r") as f:
+                entry = json.load(f)
+            return PartResult(
+                part=entry["part"],
+                solution=entry["solution"],
+                duration=entry["duration"],
+                cached=True,
+                fused=entry.get("fused", False),
+            )
+        except (ValueError, KeyError):
+            logger.warning(f"Ignoring corrupt result cache entry {key}")
+            return None
+
+    def store(self, key: Optional[str], result: PartResult) -> None:
+        solution = result.solution
+        # Parts that did not finish in the sandbox are never cached
+        if key is None or solution is None:
+            return
+        # Some solvers return numpy integers, which JSON can't serialize
+        if not isinstance(solution, str):
+            solution = int(solution)
+        entry = {
+            "part": result.part,
+            "solution": solution,
+            "duration": result.duration,
+            "fused": result.fused,
+        }
+        entry_file = self._cache_dir / f"{key}.json"
+        tmp_file = self._cache_dir / f"{key}.tmp"
+        with tmp_file.open(mode="w") as f:
+            json.dump(entry, f)
+        tmp_file.replace(entry_file)
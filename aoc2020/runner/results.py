@@ -0,0 +1,80 @@
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from aoc2020.profiling import PhaseAllocations
+
+Solution = Union[int, str]
+
+
+@dataclass
+class PartResult:
+    part: int
+    solution: Optional[Solution]  # None if the part did not finish
+    duration: float  # In seconds
+    expected: Optional[Solution] = None
+    cached: bool = False  # Duration is the one of the original solve
+    fused: bool = False  # Duration covers both parts, solved in one pass
+    concurrent: bool = False  # Both parts ran at once, in forked children
+    metrics: Dict[str, float] = field(default_factory=dict)
+    status: str = "OK"  # Or TIMEOUT, OOM or ERROR when run in a sandbox
+    detail: str = ""
+
+    @property
+    def correct(self) -> Optional[bool]:
+        if self.expected is None:
+            return None
+        return self.solution == self.expected
+
+
+@dataclass
+class SolverResult:
+    is_test: bool
+    parts: List[PartResult] = field(default_factory=list)
+    # Duration of import, construct, parse and solve phases, in seconds
+    phases: Dict[str, float] = field(default_factory=dict)
+    # CPU time of the construct and solve phases, in seconds
+    cpu: Dict[str, float] = field(default_factory=dict)
+    # Resident set high-water mark during each phase in bytes, Linux only
+    peak_rss: Dict[str, int] = field(default_factory=dict)
+    input_size: int = 0  # In bytes
+    # Phase name to the pstats file it was profiled to
+    profiles: Dict[str, str] = field(default_factory=dict)
+    # Phase name to the file with its collapsed stack samples
+    samples: Dict[str, str] = field(default_factory=dict)
+    allocations: Dict[str, "PhaseAllocations"] = field(default_factory=dict)
+
+    @property
+    def cached(self) -> bool:
+        return any(part.cached for part in self.parts)
+
+
+@dataclass
+class DayResult:
+    day: int
+    demo: SolverResult
+    general: Optional[SolverResult] = None
+    duration: float = 0.  # In seconds
+
+    @property
+    def cached(self) -> bool:
+        return self.demo.cached or (
+            self.general is not None and self.general.cached
+        )
+
+
+def _json_default(value: Any) -> Any:
+    # Numpy integers returned by some solvers
+    return int(value)
+
+
+def write_results(results: List[DayResult], path: Path) -> None:
+    with path.open(mode="w") as f:
+        json.dump(
+            [asdict(result) for result in results],
+            f,
+            indent=2,
+            default=_json_default,
+        )
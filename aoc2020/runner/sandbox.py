@@ -0,0 +1,169 @@
+import multiprocessing
+import os
+import resource
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, List, Optional
+
+OK = "OK"
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+ERROR = "ERROR"
+
+# How native code dies when an allocation fails under the address space limit
+_RLIMIT_SIGNALS = {signal.SIGSEGV, signal.SIGBUS, signal.SIGABRT}
+
+
+@dataclass
+class SandboxLimits:
+    timeout: Optional[float] = None  # Wall-clock seconds per part
+    memory: Optional[int] = None  # Address space of the child in bytes
+
+
+@dataclass
+class SandboxOutcome:
+    status: str
+    value: Any = None
+    detail: str = ""
+    duration: float = 0.  # Wall-clock seconds until the child reported
+
+
+@dataclass
+class _Child:
+    pid: int
+    receiver: Connection
+    outcome: Optional[SandboxOutcome] = None
+
+
+def _child(
+    fn: Callable[[], Any], memory: Optional[int], conn: Connection
+) -> None:
+    if memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    try:
+        outcome = SandboxOutcome(status=OK, value=fn())
+    except MemoryError:
+        outcome = SandboxOutcome(status=OOM, detail="MemoryError")
+    except Exception as e:
+        outcome = SandboxOutcome(status=ERROR, detail=repr(e))
+    # Pickling fails before anything is written, so there is a second chance
+    try:
+        conn.send(outcome)
+    except MemoryError:
+        conn.send(SandboxOutcome(status=OOM, detail="MemoryError"))
+    except Exception as e:
+        conn.send(
+            SandboxOutcome(
+                status=ERROR, detail=f"Cannot send the result: {e!r}"
+            )
+        )
+
+
+def run_sandboxed(fn: Callable[[], Any], limits: SandboxLimits) -> SandboxOutcome:
+    """Run fn in a forked child process within the limits
+
+    The child inherits the constructed solver, so only the part itself runs
+    under the limits. Its return value has to be picklable.
+    """
+    return run_sandboxed_all([fn], limits)[0]
+
+
+def run_sandboxed_all(
+    fns: List[Callable[[], Any]], limits: SandboxLimits
+) -> List[SandboxOutcome]:
+    """Run each fn in its own forked child, all at the same time
+
+    Children share the memory of the parent copy-on-write and never see each
+    other's changes to it. Each one gets the full limits, the timeout counts
+    from the moment they all started.
+    """
+    start = time.perf_counter()
+    children: List[_Child] = []
+    try:
+        for fn in fns:
+            children.append(_start(fn, limits.memory))
+        pending = list(children)
+        while len(pending) > 0:
+            timeout = None
+            if limits.timeout is not None:
+                timeout = max(start + limits.timeout - time.perf_counter(), 0.)
+            ready = wait(
+                [child.receiver for child in pending], timeout=timeout
+            )
+            if len(ready) == 0:
+                break
+            done = [child for child in pending if child.receiver in ready]
+            for child in done:
+                pending.remove(child)
+                child.outcome = _receive(child, limits.memory)
+                child.outcome.duration = time.perf_counter() - start
+        for child in pending:
+            child.outcome = SandboxOutcome(
+                status=TIMEOUT,
+                detail=f"exceeded {limits.timeout:.1f}s",
+                duration=time.perf_counter() - start,
+            )
+    finally:
+        for child in children:
+            _reap(child, kill=True)
+            child.receiver.close()
+    return [child.outcome for child in children if child.outcome is not None]
+
+
+def _start(fn: Callable[[], Any], memory: Optional[int]) -> _Child:
+    # A plain fork rather than multiprocessing.Process, which refuses to start
+    # children from the daemonic pool workers of Python before 3.9
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            receiver.close()
+            _child(fn, memory, sender)
+            code = 0
+        finally:
+            # Never return into the stack of the parent
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+    sender.close()
+    return _Child(pid=pid, receiver=receiver)
+
+
+def _reap(child: _Child, kill: bool) -> int:
+    if kill:
+        try:
+            os.kill(child.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    try:
+        _, status = os.waitpid(child.pid, 0)
+    except ChildProcessError:
+        # Already reaped
+        return 0
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _receive(child: _Child, memory: Optional[int]) -> SandboxOutcome:
+    try:
+        return child.receiver.recv()
+    except EOFError:
+        pass
+    # Died without reporting, e.g. a failed allocation in native code
+    exitcode = _reap(child, kill=False)
+    if exitcode >= 0:
+        return SandboxOutcome(status=ERROR, detail=f"exit code {exitcode}")
+    try:
+        name = signal.Signals(-exitcode).name
+    except ValueError:
+        name = f"signal {-exitcode}"
+    if memory is not None and -exitcode in _RLIMIT_SIGNALS:
+        return SandboxOutcome(
+            status=OOM, detail=f"killed by {name} under the memory limit"
+        )
+    return SandboxOutcome(status=ERROR, detail=f"killed by {name}")
@@ -0,0 +1,76 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from aoc2020.solvers import SolverFactory
+from aoc2020.utils.paths import get_cache_dir
+
+logger = logging.getLogger("Scheduling")
+
+
+def parse_days(spec: str) -> List[int]:
+    """Parse a day specification such as 'all', '7', '1-25' or '1,3,5-7'"""
+    spec = spec.strip().lower()
+    if spec == "all":
+        return SolverFactory.available_days()
+
+    days = set()
+    for part in spec.split(","):
+        part = part.strip()
+        bounds = part.split("-")
+        try:
+            if len(bounds) == 1:
+                days.add(int(bounds[0]))
+            elif len(bounds) == 2:
+                first, last = int(bounds[0]), int(bounds[1])
+                if first > last:
+                    raise ValueError
+                days.update(range(first, last + 1))
+            else:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Invalid day specification '{part}'")
+
+    missing = {day for day in days if not SolverFactory.has_solver(day)}
+    if len(missing) > 0:
+        raise ValueError(
+            f"No solver registered for day(s) "
+            f"{', '.join(map(str, sorted(missing)))}"
+        )
+    return sorted(days)
+
+
+class TimingHistory:
+    """Wall clock duration of the last full run of each day"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path if path is not None else get_cache_dir() / "timings.json"
+        self._timings: Dict[int, float] = {}
+        if self._path.is_file():
+            try:
+                with self._path.open(mode="r") as f:
+                    raw = json.load(f)
+                self._timings = {int(k): float(v) for k, v in raw.items()}
+            except (ValueError, AttributeError):
+                logger.warning(f"Ignoring corrupt timing file {self._path}")
+
+    def estimate(self, day: int) -> Optional[float]:
+        return self._timings.get(day)
+
+    def record(self, day: int, duration: float) -> None:
+        self._timings[day] = duration
+
+    def save(self) -> None:
+        tmp_path = self._path.with_suffix(".tmp")
+        with tmp_path.open(mode="w") as f:
+            json.dump({str(k): v for k, v in self._timings.items()}, f)
+        tmp_path.replace(self._path)
+
+    def longest_first(self, days: Iterable[int]) -> List[int]:
+        # Days without history are scheduled first, they might be slow ones
+        def key(day: int) -> float:
+            estimate = self.estimate(day)
+            return float("inf") if estimate is None else estimate
+
+        return sorted(days, key=key, reverse=True)
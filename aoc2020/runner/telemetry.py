@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from aoc2020.runner.results import (
+    DayResult,
+    Solution,
+    SolverResult,
+    _json_default,
+)
+from aoc2020.solvers.progress import ProgressUpdate
+from aoc2020.utils.system import host_info
+
+PART_PHASES = {"solve_1": 1, "solve_2": 2}
+
+
+@dataclass
+class TelemetryRecord:
+    run_id: str
+    timestamp: float
+    day: int
+    phase: str
+    input: str  # Either demo or real
+    input_size: int  # In bytes
+    wall: float  # In seconds
+    cpu: Optional[float] = None  # In seconds
+    peak_rss: Optional[int] = None  # High-water mark of the phase in bytes
+    part: Optional[int] = None  # Only set for the phases solving a part
+    answer: Optional[Union[Solution, List[Solution]]] = None
+    verified: Optional[bool] = None  # Only known on demo input
+    cached: bool = False
+    status: str = "OK"  # Or TIMEOUT, OOM or ERROR when run in a sandbox
+    host: Dict[str, Union[str, int]] = field(default_factory=dict)
+    event: str = "phase"
+
+
+@dataclass
+class ProgressRecord:
+    run_id: str
+    timestamp: float
+    pid: int
+    name: str  # Solver and loop
+    done: int
+    total: Optional[int]
+    rate: float  # Iterations per second
+    eta: Optional[float]  # In seconds
+    final: bool
+    event: str = "progress"
+
+
+def solver_records(
+    day: int, result: SolverResult, run_id: str
+) -> List[TelemetryRecord]:
+    host = host_info()
+    common: Dict[str, Any] = {
+        "run_id": run_id,
+        "timestamp": time.time(),
+        "day": day,
+        "input": "demo" if result.is_test else "real",
+        "input_size": result.input_size,
+        "host": host,
+    }
+    records = []
+    for phase, wall in result.phases.items():
+        record = TelemetryRecord(
+            phase=phase,
+            wall=wall,
+            cpu=result.cpu.get(phase),
+            peak_rss=result.peak_rss.get(phase),
+            **common,
+        )
+        if phase == "solve_both":
+            answers = [
+                part.solution for part in result.parts
+                if part.solution is not None
+            ]
+            # Parts that did not finish have no answer
+            if len(answers) == len(result.parts):
+                record.answer = answers
+            record.status = result.parts[0].status
+            checks = [part.correct for part in result.parts]
+            if all(check is not None for check in checks):
+                record.verified = all(checks)
+        records.append(record)
+    for part in result.parts:
+        phase = f"solve_{part.part}"
+        if phase in result.phases:
+            record = next(r for r in records if r.phase == phase)
+        elif part.cached:
+            record = TelemetryRecord(
+                phase=phase, wall=part.duration, cached=True, **common
+            )
+            records.append(record)
+        else:
+            continue
+        record.part = part.part
+        record.answer = part.solution
+        record.status = part.status
+        record.verified = part.correct
+    return records
+
+
+def day_records(result: DayResult, run_id: str) -> List[TelemetryRecord]:
+    records = solver_records(day=result.day, result=result.demo, run_id=run_id)
+    if result.general is not None:
+        records.extend(
+            solver_records(day=result.day, result=result.general, run_id=run_id)
+        )
+    return records
+
+
+class TelemetryWriter:
+    """Appends JSONL telemetry records to a file, or to stdout for '-'"""
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        self.run_id = uuid.uuid4().hex
+
+    def _write(self, f: TextIO, records: List[Any]) -> None:
+        for record in records:
+            f.write(json.dumps(asdict(record), default=_json_default) + "\n")
+        f.flush()
+
+    def write(self, result: DayResult) -> None:
+        self._write_records(day_records(result=result, run_id=self.run_id))
+
+    def progress(self, update: ProgressUpdate) -> None:
+        """Progress sink, also called from worker processes
+
+        Every record is a single appended line, so records of concurrent
+        workers do not interleave within a line.
+        """
+        record = ProgressRecord(
+            run_id=self.run_id,
+            timestamp=time.time(),
+            pid=os.getpid(),
+            name=update.name,
+            done=update.done,
+            total=update.total,
+            rate=update.rate,
+            eta=update.eta,
+            final=update.final,
+        )
+        self._write_records([record])
+
+    def _write_records(self, records: List[Any]) -> None:
+        if str(self.path) == "-":
+            self._write(sys.stdout, records)
+        else:
+            with self.path.open(mode="a") as f:
+                self._write(f, records)
@@ -1,92 +1,397 @@
 import argparse
 import logging
 import time
+from pathlib import Path
+from typing import Callable, List, Optional
 
-from aoc2020.data import DataFactory
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.runner import (
+    ConcurrencyLimits,
+    DayResult,
+    Instruments,
+    ResultCache,
+    SandboxLimits,
+    SolverResult,
+    TelemetryWriter,
+    TimingHistory,
+    log_day_result,
+    parse_days,
+    run_day,
+    run_parallel,
+    run_streaming,
+    write_results,
+)
+from aoc2020.solvers import (
+    PuzzleSolver,
+    SolverFactory,
+    configure_tracing,
+    enable_checkpoints,
+    enable_out_of_core,
+    enable_parse_cache,
+    enable_progress,
+)
+from aoc2020.solvers.progress import ProgressReporter
 
 
 logger = logging.getLogger("AoCRunner")
 
 
-def run_solver(solver: PuzzleSolver, is_test: bool) -> None:
-    correct = True
-    a = time.time()
-    solution_1 = solver.solve_1()
-    b = time.time()
-    if is_test:
-        if solver.demo_result_1 is None:
-            logger.warning(f"No demo result available for part one")
-        elif solution_1 != solver.demo_result_1:
-            logger.error(
-                f"[Part one] Expected result {solver.demo_result_1}, "
-                f"got {solution_1}."
-            )
-            correct = False
-    else:
-        logger.info(
-            f"[Part one]: Solution is {solution_1} "
-            f"(solved in {(b-a)*1000.:.2f}ms)"
-        )
+def _profile_top(instruments: Optional[Instruments]) -> Optional[int]:
+    if instruments is None or instruments.profiler is None:
+        return None
+    return instruments.profiler.top
 
-    a = time.time()
-    solution_2 = solver.solve_2()
-    b = time.time()
-    if is_test:
-        if solver.demo_result_2 is None:
-            logger.warning(f"No demo result available for part two")
-        elif solution_2 != solver.demo_result_2:
-            logger.error(
-                f"[Part two] Expected result {solver.demo_result_2}, "
-                f"got {solution_2}."
-            )
-            correct = False
+
+def run(
+    day: int,
+    demo_only: bool,
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+) -> DayResult:
+    result = run_day(
+        day=day, demo_only=demo_only, cache=cache, instruments=instruments,
+        limits=limits, fork_parts=fork_parts,
+    )
+    log_day_result(result, profile_top=_profile_top(instruments))
+    # Keep track of the duration to schedule parallel runs
+    if not demo_only and not result.cached:
+        history = TimingHistory()
+        history.record(day=day, duration=result.duration)
+        history.save()
+    return result
+
+
+def run_all(
+    days: List[int],
+    demo_only: bool,
+    jobs: Optional[int],
+    cache: Optional[ResultCache] = None,
+    instruments: Optional[Instruments] = None,
+    limits: Optional[SandboxLimits] = None,
+    fork_parts: bool = False,
+    concurrency: Optional[ConcurrencyLimits] = None,
+    on_result: Optional[Callable[[DayResult], None]] = None,
+) -> List[DayResult]:
+    # With concurrency limits, days are logged and passed on as they finish
+    start = time.time()
+    profile_top = _profile_top(instruments)
+    if concurrency is not None:
+        def report(result: DayResult) -> None:
+            log_day_result(result, profile_top=profile_top)
+            if on_result is not None:
+                on_result(result)
+
+        results = run_streaming(
+            days=days, demo_only=demo_only, on_result=report,
+            concurrency=concurrency, cache=cache, instruments=instruments,
+            limits=limits, fork_parts=fork_parts,
+        )
     else:
-        logger.info(
-            f"[Part two]: Solution is {solution_2} "
-            f"(solved in {(b-a)*1000.:.2f}ms)"
+        results = run_parallel(
+            days=days, demo_only=demo_only, jobs=jobs, cache=cache,
+            instruments=instruments, limits=limits, fork_parts=fork_parts,
         )
-
-    if is_test and correct:
-        logger.info(f"Congrats, both demo parts verified correctly!")
+        for result in results:
+            log_day_result(result, profile_top=profile_top)
+            if on_result is not None:
+                on_result(result)
+    solver_results: List[SolverResult] = [r.demo for r in results] + [
+        r.general for r in results if r.general is not None
+    ]
+    parts = [part for res in solver_results for part in res.parts]
+    cached = sum(1 for part in parts if part.cached)
+    failed = sum(1 for part in parts if part.status != "OK")
+    logger.info(
+        f"Solved {len(results)} days in {time.time() - start:.2f}s "
+        f"({len(parts) - cached - failed} parts solved, {cached} from cache, "
+        f"{failed} failed)"
+    )
+    return results
 
 
-def run(day: int, demo_only: bool) -> None:
-    demo_file = DataFactory.get_demo_file(day=day)
-    demo_solver = SolverFactory.create_solver(day=day, input_file=demo_file)
+def apply_parameters(days: List[int], params: List[str]) -> None:
+    """Set NAME=VALUE problem sizes on the solvers of the days declaring them"""
+    for param in params:
+        name, _, value = param.partition("=")
+        try:
+            size = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid parameter '{param}', expected NAME=INT")
+        solver_classes = [
+            SolverFactory.get_solver_class(day=day) for day in days
+        ]
+        matches = [cls for cls in solver_classes if name in cls.parameters]
+        if len(matches) == 0:
+            raise ValueError(f"No selected solver has a parameter {name}")
+        for solver_class in matches:
+            minimum = solver_class.parameter_minimum(name)
+            if size < minimum:
+                raise ValueError(
+                    f"Invalid parameter '{param}', {solver_class.__name__} "
+                    f"needs {name} to be at least {minimum}"
+                )
+        for solver_class in matches:
+            setattr(solver_class, name, size)
+            logger.debug(f"Set {solver_class.__name__}.{name} to {size}")
 
-    # Run demo
-    logger.info(f"Running demo")
-    run_solver(solver=demo_solver, is_test=True)
-    logger.info(f"")
 
-    if not demo_only:
-        general_file = DataFactory.get_input_file(day=day)
-        general_solver = SolverFactory.create_solver(day=day, input_file=general_file)
+def run_import_profile(day: int, output: Path) -> None:
+    from aoc2020.profiling import (
+        format_import_table,
+        profile_imports,
+        write_import_profile,
+    )
 
-        # Run actual solver
-        logger.info(f"Running solver")
-        run_solver(solver=general_solver, is_test=False)
+    records = profile_imports(day=day)
+    print(format_import_table(records))
+    write_import_profile(records=records, day=day, path=output)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Solve an advent of code puzzle"
     )
-    parser.add_argument("day", type=int, help="Day of puzzle to solve")
+    parser.add_argument(
+        "day",
+        help="Day(s) of puzzle to solve: a day, 'all', a range such as "
+             "'1-25' or a comma separated list",
+    )
     parser.add_argument(
         "-v", "--verbose", help="Output debug logging", action="store_true"
     )
     parser.add_argument(
         "-d", "--demo", help="Only run on demo input", action="store_true"
     )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of worker processes when solving multiple days "
+             "(defaults to the number of cores)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Solve every part again instead of using cached solutions",
+    )
+    parser.add_argument(
+        "--parse-cache", action="store_true",
+        help="Cache parsed inputs on disk, keyed by input and parser version",
+    )
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="Collect and print the hot path counters and timers of solvers",
+    )
+    parser.add_argument(
+        "--trace", default=None, metavar="SPEC",
+        help="Enable debug traces of solver hot loops, e.g. "
+             "'SolverDay5:seats,SolverDay7' or '*' for all",
+    )
+    parser.add_argument(
+        "--json", type=Path, default=None, metavar="PATH",
+        help="Write the results, including phase timings, as JSON",
+    )
+    parser.add_argument(
+        "--telemetry", default=None, metavar="PATH",
+        help="Append one JSON record per solver phase to PATH, or write them "
+             "to stdout for '-'",
+    )
+    parser.add_argument(
+        "--progress", nargs="?", default=None, const="stderr",
+        choices=["stderr", "telemetry"],
+        help="Report progress, iterations per second and ETA of long-running "
+             "loops to stderr (default) or as --telemetry records",
+    )
+    parser.add_argument(
+        "--checkpoint", type=float, nargs="?", default=None, const=30.,
+        metavar="SECONDS",
+        help="Checkpoint long-running loops every SECONDS (default: 30) and "
+             "resume from the last checkpoint of the same day, input and "
+             "parameters",
+    )
+    parser.add_argument(
+        "--param", action="append", default=[], metavar="NAME=VALUE",
+        help="Set a problem size of the selected solvers, e.g. "
+             "turns_2=300000000 for day 15 or cups_2=10000000 for day 23",
+    )
+    parser.add_argument(
+        "--out-of-core", type=Path, nargs="?", default=None, const="",
+        metavar="DIR",
+        help="Keep large state tables in memory-mapped files in DIR instead "
+             "of RAM (default: the cache dir)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None, metavar="SECONDS",
+        help="Run each part in a child process and report TIMEOUT when it "
+             "takes longer than SECONDS",
+    )
+    parser.add_argument(
+        "--memory-limit", type=int, default=None, metavar="MIB",
+        help="Run each part in a child process with an address space limit "
+             "and report OOM when it is exceeded",
+    )
+    parser.add_argument(
+        "--fork-parts", action="store_true",
+        help="Parse once and solve both parts at the same time in forked "
+             "workers, for days with expensive independent parts",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Solve days in worker processes with bounded queueing and "
+             "report each day as soon as it finishes",
+    )
+    parser.add_argument(
+        "--io-workers", type=int, default=4, metavar="N",
+        help="Threads resolving input files with --stream",
+    )
+    parser.add_argument(
+        "--prefetch", type=int, default=2, metavar="N",
+        help="Days queued ahead of a free worker with --stream",
+    )
+    parser.add_argument(
+        "--import-profile", type=Path, nargs="?", default=None,
+        const=Path("import_profile.json"), metavar="PATH",
+        help="Rank the import cost of each module up to the first solver "
+             "and write it as JSON (default: import_profile.json)",
+    )
+    parser.add_argument(
+        "--profile", type=Path, nargs="?", default=None,
+        const=Path("profiles"), metavar="DIR",
+        help="Run construction and each part under cProfile and write one "
+             "pstats file per day and part to DIR (default: profiles)",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=15, metavar="N",
+        help="Number of functions to print per profile, by cumulative and "
+             "by self time",
+    )
+    parser.add_argument(
+        "--trace-alloc", action="store_true",
+        help="Trace allocations of construction and each part and print the "
+             "top allocation sites and peak of each (included in --json)",
+    )
+    parser.add_argument(
+        "--trace-alloc-top", type=int, default=10, metavar="N",
+        help="Number of allocation sites to report per phase",
+    )
+    parser.add_argument(
+        "--sample", type=Path, nargs="?", default=None,
+        const=Path("samples"), metavar="DIR",
+        help="Sample the stack of construction and each part on a CPU timer "
+             "and write collapsed stacks for flame graph tools to DIR "
+             "(default: samples)",
+    )
+    parser.add_argument(
+        "--sample-rate", type=float, default=1000., metavar="HZ",
+        help="Stack samples per second of CPU time",
+    )
     args = parser.parse_args()
     if args.verbose:
         level = logging.DEBUG
     else:
         level = logging.INFO
     logging.basicConfig(level=level)
-    run(day=args.day, demo_only=args.demo)
+    if args.parse_cache:
+        enable_parse_cache()
+    if args.metrics:
+        PuzzleSolver.collect_metrics = True
+    if args.checkpoint is not None:
+        enable_checkpoints(interval=args.checkpoint)
+    if args.trace is not None:
+        configure_tracing(args.trace)
+    telemetry = None
+    if args.telemetry is not None:
+        telemetry = TelemetryWriter(path=args.telemetry)
+    if args.progress == "telemetry":
+        if telemetry is None:
+            parser.error(f"Progress as telemetry needs --telemetry")
+        enable_progress(ProgressReporter(sink=telemetry.progress, interval=5.))
+    elif args.progress == "stderr":
+        enable_progress()
+    try:
+        days = parse_days(args.day)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.jobs is not None and args.jobs < 1:
+        parser.error(f"Invalid --jobs {args.jobs}, expected at least 1")
+    instruments = Instruments()
+    # The profiling tools are only imported when asked for, they slow down
+    # the startup of every run
+    if args.profile is not None:
+        from aoc2020.profiling import CProfiler
+
+        instruments.profiler = CProfiler(
+            output_dir=args.profile, top=args.profile_top
+        )
+    if args.sample is not None:
+        from aoc2020.profiling import StackSampler
+
+        instruments.sampler = StackSampler(
+            output_dir=args.sample, rate=args.sample_rate
+        )
+    if args.trace_alloc:
+        from aoc2020.profiling import AllocationTracer
+
+        instruments.tracer = AllocationTracer(top=args.trace_alloc_top)
+    try:
+        apply_parameters(days=days, params=args.param)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.out_of_core is not None:
+        # Without DIR, the cache dir is only resolved (and created) now
+        enable_out_of_core(state_dir=args.out_of_core or None)
+    limits = None
+    if args.timeout is not None or args.memory_limit is not None:
+        if instruments.enabled:
+            parser.error(
+                f"Profiling and tracing do not support sandboxed parts"
+            )
+        memory = args.memory_limit
+        limits = SandboxLimits(
+            timeout=args.timeout,
+            memory=memory * 1024 * 1024 if memory is not None else None,
+        )
+    if args.fork_parts and instruments.enabled:
+        parser.error(f"Profiling and tracing do not support --fork-parts")
+    concurrency = None
+    if args.stream:
+        if args.io_workers < 1 or args.prefetch < 0:
+            parser.error(f"Invalid --io-workers or --prefetch")
+        concurrency = ConcurrencyLimits(
+            jobs=args.jobs, io_workers=args.io_workers, prefetch=args.prefetch
+        )
+    # Cached parts are not run, so there would be nothing to instrument,
+    # count, trace, report or checkpoint
+    observed = (
+        instruments.enabled
+        or args.metrics
+        or args.trace is not None
+        or args.progress is not None
+        or args.checkpoint is not None
+    )
+    cache = ResultCache(read=not args.no_cache and not observed)
+    if args.import_profile is not None:
+        if len(days) != 1:
+            parser.error(f"Import profiling supports a single day only")
+        run_import_profile(day=days[0], output=args.import_profile)
+    else:
+        if len(days) == 1 and not args.stream:
+            results = [
+                run(
+                    day=days[0], demo_only=args.demo, cache=cache,
+                    instruments=instruments, limits=limits,
+                    fork_parts=args.fork_parts,
+                )
+            ]
+            if telemetry is not None:
+                telemetry.write(results[0])
+        else:
+            results = run_all(
+                days=days, demo_only=args.demo, jobs=args.jobs, cache=cache,
+                instruments=instruments, limits=limits,
+                fork_parts=args.fork_parts, concurrency=concurrency,
+                on_result=telemetry.write if telemetry is not None else None,
+            )
+        if args.json is not None:
+            write_results(results=results, path=args.json)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,22 @@
-from .puzzle_solver import PuzzleSolver
+from .puzzle_solver import (
+    PuzzleSolver,
+    cached_step,
+    enable_checkpoints,
+    enable_out_of_core,
+    enable_parse_cache,
+    enable_progress,
+)
 from .solver_factory import SolverFactory
+from .tracing import configure_tracing, trace_channel
 
-from .implementations import *
-
-__all__ = ["PuzzleSolver", "SolverFactory"]
+__all__ = [
+    "PuzzleSolver",
+    "SolverFactory",
+    "cached_step",
+    "enable_checkpoints",
+    "configure_tracing",
+    "enable_out_of_core",
+    "enable_parse_cache",
+    "enable_progress",
+    "trace_channel",
+]
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import struct
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from aoc2020.solvers.state_table import StateTable, table_typecode
+from aoc2020.utils.hashing import hash_file
+from aoc2020.utils.paths import get_cache_dir
+
+if TYPE_CHECKING:
+    from aoc2020.solvers.puzzle_solver import PuzzleSolver
+
+logger = logging.getLogger("Checkpoint")
+
+# File layout: magic, header length, JSON header, raw bytes of each table
+_MAGIC = b"AOCCKPT1"
+_LENGTH = struct.Struct("<I")
+
+Scalars = Dict[str, Any]
+Tables = Dict[str, StateTable]
+
+
+class CheckpointSession:
+    """Checkpoints of one loop of one solver on one input
+
+    Loops check `due` between chunks of iterations and `save` their scalar
+    state and flat state tables. Tables are written as raw bytes, so a
+    checkpoint costs about as much as copying them. On resume they are read
+    back into tables the loop allocated, in memory or memory-mapped.
+    """
+
+    def __init__(self, path: Path, interval: float):
+        self.path = path
+        self.interval = interval  # Seconds between checkpoints
+        self._last = time.perf_counter()
+
+    def due(self) -> bool:
+        return time.perf_counter() - self._last >= self.interval
+
+    def load(self, tables: Tables) -> Optional[Scalars]:
+        """Fill the tables from the checkpoint and return its scalars"""
+        try:
+            with self.path.open(mode="rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    raise ValueError(f"Not a checkpoint file")
+                (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                header = json.loads(f.read(length))
+                views = []
+                for name, typecode, count in header["tables"]:
+                    table = tables[name]
+                    if (typecode, count) != (table_typecode(table), len(table)):
+                        raise ValueError(f"Table {name} does not match")
+                    views.append(memoryview(table).cast("B"))
+                # Validate before reading, tables are left untouched on errors
+                expected = f.tell() + sum(len(view) for view in views)
+                if self.path.stat().st_size != expected:
+                    raise EOFError(f"Checkpoint is truncated")
+                for view in views:
+                    f.readinto(view)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, KeyError, struct.error):
+            logger.warning(f"Ignoring corrupt checkpoint {self.path}")
+            return None
+        return header["scalars"]
+
+    def save(self, scalars: Scalars, tables: Tables) -> None:
+        a = time.perf_counter()
+        header = json.dumps({
+            "scalars": scalars,
+            "tables": [
+                [name, table_typecode(table), len(table)]
+                for name, table in tables.items()
+            ],
+        }).encode()
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open(mode="wb") as f:
+            f.write(_MAGIC)
+            f.write(_LENGTH.pack(len(header)))
+            f.write(header)
+            for table in tables.values():
+                f.write(memoryview(table).cast("B"))
+        # A killed run leaves either the previous or the new checkpoint
+        tmp_path.replace(self.path)
+        self._last = time.perf_counter()
+        logger.debug(
+            f"Wrote checkpoint {self.path.name} in "
+            f"{(self._last - a)*1000.:.1f}ms"
+        )
+
+    def clear(self) -> None:
+        # The loop finished, there is nothing left to resume
+        if self.path.exists():
+            self.path.unlink()
+
+
+class NullCheckpointSession(CheckpointSession):
+    """Never due and never resumes, used when checkpoints are off"""
+
+    def __init__(self):
+        super().__init__(path=Path(), interval=0.)
+
+    def due(self) -> bool:
+        return False
+
+    def load(self, tables: Tables) -> Optional[Scalars]:
+        return None
+
+    def save(self, scalars: Scalars, tables: Tables) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+NULL_CHECKPOINT = NullCheckpointSession()
+
+
+class CheckpointStore:
+    def __init__(self, cache_dir: Optional[Path] = None, interval: float = 30.):
+        if cache_dir is None:
+            cache_dir = get_cache_dir() / "checkpoints"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = cache_dir
+        self.interval = interval
+
+    @staticmethod
+    def key(solver: "PuzzleSolver", name: str, params: Dict[str, Any]) -> str:
+        solver_class = type(solver)
+        parts = [
+            f"{solver_class.__module__}.{solver_class.__qualname__}",
+            name,
+            hash_file(solver._input_file),
+            json.dumps(params, sort_keys=True),
+        ]
+        return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+    def session(
+        self, solver: "PuzzleSolver", name: str, params: Dict[str, Any]
+    ) -> CheckpointSession:
+        key = self.key(solver=solver, name=name, params=params)
+        return CheckpointSession(
+            path=self._cache_dir / f"{key}.ckpt", interval=self.interval
+        )
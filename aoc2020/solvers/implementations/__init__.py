@@ -1,55 +1,45 @@
-from .day1 import SolverDay1
-from .day2 import SolverDay2
-from .day3 import SolverDay3
-from .day4 import SolverDay4
-from .day5 import SolverDay5
-from .day6 import SolverDay6
-from .day7 import SolverDay7
-from .day8 import SolverDay8
-from .day9 import SolverDay9
-from .day10 import SolverDay10
-from .day11 import SolverDay11
-from .day12 import SolverDay12
-from .day13 import SolverDay13
-from .day14 import SolverDay14
-from .day15 import SolverDay15
-from .day16 import SolverDay16
-from .day17 import SolverDay17
-from .day18 import SolverDay18
-from .day19 import SolverDay19
-from .day20 import SolverDay20
-from .day21 import SolverDay21
-from .day22 import SolverDay22
-from .day23 import SolverDay23
-from .day24 import SolverDay24
-from .day25 import SolverDay25
-# IMPORT_PH1
+# Mapping from day to the module implementing its solver. Modules are only
+#  imported when a solver for that day is requested, see SolverFactory.
+from typing import Dict
 
-__all__ = [
-    "SolverDay1",
-    "SolverDay2",
-    "SolverDay3",
-    "SolverDay4",
-    "SolverDay5",
-    "SolverDay6",
-    "SolverDay7",
-    "SolverDay8",
-    "SolverDay9",
-    "SolverDay10",
-    "SolverDay11",
-    "SolverDay12",
-    "SolverDay13",
-    "SolverDay14",
-    "SolverDay15",
-    "SolverDay16",
-    "SolverDay17",
-    "SolverDay18",
-    "SolverDay19",
-    "SolverDay20",
-    "SolverDay21",
-    "SolverDay22",
-    "SolverDay23",
-    "SolverDay24",
-    "SolverDay25",
-    # IMPORT_PH2
-]
+SOLVER_MODULES: Dict[int, str] = {
+    1: "aoc2020.solvers.implementations.day1",
+    2: "aoc2020.solvers.implementations.day2",
+    3: "aoc2020.solvers.implementations.day3",
+    4: "aoc2020.solvers.implementations.day4",
+    5: "aoc2020.solvers.implementations.day5",
+    6: "aoc2020.solvers.implementations.day6",
+    7: "aoc2020.solvers.implementations.day7",
+    8: "aoc2020.solvers.implementations.day8",
+    9: "aoc2020.solvers.implementations.day9",
+    10: "aoc2020.solvers.implementations.day10",
+    11: "aoc2020.solvers.implementations.day11",
+    12: "aoc2020.solvers.implementations.day12",
+    13: "aoc2020.solvers.implementations.day13",
+    14: "aoc2020.solvers.implementations.day14",
+    15: "aoc2020.solvers.implementations.day15",
+    16: "aoc2020.solvers.implementations.day16",
+    17: "aoc2020.solvers.implementations.day17",
+    18: "aoc2020.solvers.implementations.day18",
+    19: "aoc2020.solvers.implementations.day19",
+    20: "aoc2020.solvers.implementations.day20",
+    21: "aoc2020.solvers.implementations.day21",
+    22: "aoc2020.solvers.implementations.day22",
+    23: "aoc2020.solvers.implementations.day23",
+    24: "aoc2020.solvers.implementations.day24",
+    25: "aoc2020.solvers.implementations.day25",
+    # IMPORT_PH1
+}
+
+
+def __getattr__(name: str):
+    # Keep `from aoc2020.solvers.implementations import SolverDayX` working
+    if name.startswith("SolverDay"):
+        try:
+            day = int(name[len("SolverDay"):])
+        except ValueError:
+            day = -1
+        if day in SOLVER_MODULES:
+            from aoc2020.solvers.solver_factory import SolverFactory
+            return SolverFactory.get_solver_class(day=day)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
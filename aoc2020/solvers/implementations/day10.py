@@ -61,7 +61,9 @@ class SolverDay10(PuzzleSolver):
         # number of adapters is a unique key for a state
         cache_key = (cur_jolts, adapters[0], len(adapters))
         if cache_key in results_cache:
+            self.metrics.incr("cache_hits")
             return results_cache[cache_key]
+        self.metrics.incr("cache_misses")
         # Count possibilities recursively
         possibilities = 0
         for i, adapter in enumerate(adapters):
@@ -109,11 +109,13 @@ class SolverDay11(PuzzleSolver):
     def solve_1(self) -> int:
         state = self._input_data
         while True:
-            new_state = self._apply_round(
-                state=state,
-                occ_fn=self._occupied_adjacent_neighbours,
-                margin=4,
-            )
+            self.metrics.incr("rounds")
+            with self.metrics.timer("apply_round"):
+                new_state = self._apply_round(
+                    state=state,
+                    occ_fn=self._occupied_adjacent_neighbours,
+                    margin=4,
+                )
             if np.array_equal(state, new_state):
                 return int(np.sum(np.maximum(new_state, 0)))
             state = new_state
@@ -121,11 +123,13 @@ class SolverDay11(PuzzleSolver):
     def solve_2(self) -> int:
         state = self._input_data
         while True:
-            new_state = self._apply_round(
-                state=state,
-                occ_fn=self._occupied_closest_neighbours,
-                margin=5,
-            )
+            self.metrics.incr("rounds")
+            with self.metrics.timer("apply_round"):
+                new_state = self._apply_round(
+                    state=state,
+                    occ_fn=self._occupied_closest_neighbours,
+                    margin=5,
+                )
             if np.array_equal(state, new_state):
                 return int(np.sum(np.maximum(new_state, 0)))
             state = new_state
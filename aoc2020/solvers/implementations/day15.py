@@ -1,7 +1,6 @@
 import logging
-from collections import defaultdict, deque
 from pathlib import Path
-from typing import Deque, Dict, List, Optional
+from typing import List, Optional
 
 from aoc2020.solvers import PuzzleSolver, SolverFactory
 
@@ -10,16 +9,22 @@ logger = logging.getLogger("SolverDay15")
 
 @SolverFactory.register(day=15)
 class SolverDay15(PuzzleSolver):
+    independent_parts = True
+    parameters = ("turns_1", "turns_2")
+    turns_1: int = 2020
+    turns_2: int = 30000000
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
 
     @property
     def demo_result_1(self) -> Optional[int]:
-        return 436
+        # Only known for the puzzle's own problem size
+        return 436 if self.turns_1 == 2020 else None
 
     @property
     def demo_result_2(self) -> Optional[int]:
-        return 175594
+        return 175594 if self.turns_2 == 30000000 else None
 
     def _read_file(self) -> List[int]:
         with self._input_file.open(mode="r") as f:
@@ -36,23 +41,39 @@ class SolverDay15(PuzzleSolver):
 
     def _find_value(self, turn: int) -> int:
         turns = self._input_data
-        occurences: Dict[int, Deque] = defaultdict(lambda: deque(maxlen=2))
-        last_value = 0
-        for i in range(turn):
-            if i < len(turns):
-                value = turns[i]
-            else:
-                occ = occurences[last_value]
-                if len(occ) < 2:
-                    value = 0
-                else:
-                    value = occ[0] - occ[1]
-            occurences[value].appendleft(i+1)  # Turns are 1-indexed
-            last_value = value
-        return last_value
+        if turn <= len(turns):
+            return turns[turn-1]
+        # Turn in which each value was last spoken, 0 if never. Spoken values
+        # never exceed the number of turns
+        last_seen = self.state_table(
+            "last_seen", size=max(turn, max(turns) + 1), max_value=turn
+        )
+        checkpoint = self.checkpoint_session("turns", turn=turn)
+        scalars = checkpoint.load({"last_seen": last_seen})
+        if scalars is not None:
+            start, value = scalars["turn"], scalars["value"]
+            logger.info(f"Resuming from the checkpoint at turn {start}")
+        else:
+            for i, value in enumerate(turns[:-1]):
+                last_seen[value] = i + 1  # Turns are 1-indexed
+            start, value = len(turns), turns[-1]
+        with self.progress_task("turns", total=turn) as task:
+            for chunk in task.ranges(start, turn):
+                for i in chunk:
+                    # Value was spoken in turn i, the next one is the age
+                    previous = last_seen[value]
+                    last_seen[value] = i
+                    value = i - previous if previous else 0
+                if checkpoint.due():
+                    checkpoint.save(
+                        scalars={"turn": chunk.stop, "value": value},
+                        tables={"last_seen": last_seen},
+                    )
+        checkpoint.clear()
+        return value
 
     def solve_1(self) -> int:
-        return self._find_value(turn=2020)
+        return self._find_value(turn=self.turns_1)
 
     def solve_2(self) -> int:
-        return self._find_value(turn=30000000)
+        return self._find_value(turn=self.turns_2)
@@ -11,6 +11,8 @@ logger = logging.getLogger("SolverDay17")
 
 @SolverFactory.register(day=17)
 class SolverDay17(PuzzleSolver):
+    independent_parts = True
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
 
@@ -4,9 +4,10 @@ from typing import Dict, List, Optional, Type
 
 import re
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, trace_channel
 
 logger = logging.getLogger("SolverDay18")
+trace_expressions = trace_channel("SolverDay18", "expressions")
 
 """
 I originally solved this using BNF parsing using the pynetree package.
@@ -74,7 +75,8 @@ class SolverDay18(PuzzleSolver):
             line = re.sub(r"(\d+)", rf"{integertype.__name__}(\1)", line)
             # Evaluate the expression and add to sum
             res = int(eval(line))
-            logger.debug(f"Solved to {res}")
+            if trace_expressions.enabled:
+                trace_expressions("Solved to %d", res)
             res_sum += res
         return res_sum
 
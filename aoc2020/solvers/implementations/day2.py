@@ -38,21 +38,40 @@ class SolverDay2(PuzzleSolver):
     def demo_result_2(self) -> Optional[int]:
         return 1
 
+    @staticmethod
+    def _valid_count(min_count: int, max_count: int, char: str, pwd: str) -> bool:
+        return min_count <= pwd.count(char) <= max_count
+
+    @staticmethod
+    def _valid_position(pos_1: int, pos_2: int, char: str, pwd: str) -> bool:
+        pos_1 -= 1
+        pos_2 -= 1
+        if pos_1 < 0 or pos_2 < 0 or pos_1 >= len(pwd) or pos_2 >= len(pwd):
+            logger.error(f"Invalid position identifiers {pos_1}-{pos_2}")
+            return False
+        return (pwd[pos_1] == char) != (pwd[pos_2] == char)
+
     def solve_1(self) -> int:
         num_valids = 0
-        for min_count, max_count, char, pwd in self._input_data:
-            if min_count <= pwd.count(char) <= max_count:
+        for policy in self._input_data:
+            if self._valid_count(*policy):
                 num_valids += 1
         return num_valids
 
     def solve_2(self) -> int:
         num_valids = 0
-        for pos_1, pos_2, char, pwd in self._input_data:
-            pos_1 -= 1
-            pos_2 -= 1
-            if pos_1 < 0 or pos_2 < 0 or pos_1 >= len(pwd) or pos_2 >= len(pwd):
-                logger.error(f"Invalid position identifiers {pos_1}-{pos_2}")
-                continue
-            if (pwd[pos_1] == char) != (pwd[pos_2] == char):
+        for policy in self._input_data:
+            if self._valid_position(*policy):
                 num_valids += 1
         return num_valids
+
+    def solve_both(self) -> Tuple[int, int]:
+        # Check both policies in a single pass over the passwords
+        num_valids_1 = 0
+        num_valids_2 = 0
+        for policy in self._input_data:
+            if self._valid_count(*policy):
+                num_valids_1 += 1
+            if self._valid_position(*policy):
+                num_valids_2 += 1
+        return num_valids_1, num_valids_2
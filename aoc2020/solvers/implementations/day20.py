@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, cached_step
 
 logger = logging.getLogger("SolverDay20")
 
@@ -27,6 +27,8 @@ class Direction(Enum):
 
 @SolverFactory.register(day=20)
 class SolverDay20(PuzzleSolver):
+    independent_parts = True
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
         self.monster = np.array([
@@ -63,6 +65,7 @@ class SolverDay20(PuzzleSolver):
             tiles[cur_tile_id] = np.asarray(cur_lines)
         return tiles
 
+    @cached_step
     def _find_neighbours(self) -> Dict[int, np.ndarray]:
         tiles = self._input_data
         neighbourmap: Dict[int, np.ndarray] = {}
@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Set, Tuple
 
 import re
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, cached_step
 
 logger = logging.getLogger("SolverDay21")
 
@@ -37,6 +37,7 @@ class SolverDay21(PuzzleSolver):
                     logger.error(f'Failed to parse line {line}')
         return foods
 
+    @cached_step
     def _map_allergens_to_ingredients(self) -> Dict[str, Set[str]]:
         foods = self._input_data
         # Mapping between allergens and ingredients possibly containing it
@@ -81,9 +82,8 @@ class SolverDay21(PuzzleSolver):
         # Solve recursively
         return self._solve_mapping(mapping, solution)
 
-    def solve_1(self) -> int:
+    def _count_safe_ingredients(self, mapping: Dict[str, Set[str]]) -> int:
         foods = self._input_data
-        mapping = self._map_allergens_to_ingredients()
 
         # Get all ingredients (as set)
         all_ingredients: List[str] = sum([list(i) for i, _ in foods], [])
@@ -103,10 +103,23 @@ class SolverDay21(PuzzleSolver):
         # Count the number of times these ingredients occur
         return sum([ingredients_count.get(i, 0) for i in no_allergens])
 
-    def solve_2(self) -> str:
-        mapping = self._map_allergens_to_ingredients()
+    def _dangerous_ingredients(self, mapping: Dict[str, Set[str]]) -> str:
         # Solve the mapping to find which allergen is found in which ingredient
         solution = self._solve_mapping(mapping=mapping, solution={})
         # Join values with comma, based on sorted keys
         key = ",".join(ingr for _, ingr in sorted(solution.items()))
         return key
+
+    def solve_1(self) -> int:
+        mapping = self._map_allergens_to_ingredients()
+        return self._count_safe_ingredients(mapping=mapping)
+
+    def solve_2(self) -> str:
+        mapping = self._map_allergens_to_ingredients()
+        return self._dangerous_ingredients(mapping=mapping)
+
+    def solve_both(self) -> Tuple[int, str]:
+        # Part two consumes the mapping, so part one has to go first
+        mapping = self._map_allergens_to_ingredients()
+        safe_count = self._count_safe_ingredients(mapping=mapping)
+        return safe_count, self._dangerous_ingredients(mapping=mapping)
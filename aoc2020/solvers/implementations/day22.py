@@ -10,6 +10,8 @@ logger = logging.getLogger("SolverDay22")
 
 @SolverFactory.register(day=22)
 class SolverDay22(PuzzleSolver):
+    independent_parts = True
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
 
@@ -96,8 +98,8 @@ class SolverDay22(PuzzleSolver):
             deck1=deck1, deck2=deck2, history=history,
         )
 
-    @staticmethod
     def _play_looped(
+        self,
         deck1: Deque[int],
         deck2: Deque[int],
     ) -> Tuple[int, Deque[int]]:
@@ -123,12 +125,14 @@ class SolverDay22(PuzzleSolver):
                 else:
                     return winner, deck1 if winner == 1 else deck2
             # No winner, play round
+            self.metrics.incr("rounds")
             history.add(key)
             card1 = deck1.popleft()
             card2 = deck2.popleft()
             # When both players have enough cards for recursion, recurse
             if card1 <= len(deck1) and card2 <= len(deck2):
                 # Append current state to the stack
+                self.metrics.incr("sub_games")
                 stack.append((card1, card2, deck1, deck2, history))
                 # Update parameters and loop
                 deck1 = deque(list(deck1)[:card1])
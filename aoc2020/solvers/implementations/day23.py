@@ -1,90 +1,44 @@
 import logging
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers.state_table import StateTable, table_typecode
 
 logger = logging.getLogger("SolverDay23")
 
-
-class Node:
-    def __init__(
-        self,
-        value: int,
-        nxt: "Node" = None,
-    ):
-        self.value: int = value
-        self.next: "Node" = nxt  # type: ignore
-
-    def __str__(self):
-        return f"{self.value:d}"
-
-
-class LinkedList:
-    def __init__(self, values: List[int]):
-        self.head: Node = Node(values[-1])
-        last = self.head
-        # Mapping from value to node, for quick lookup
-        self.nodemap: Dict[int, Node] = {values[-1]: self.head}
-        self.minimum: int = min(values)
-        self.maximum: int = max(values)
-        for val in reversed(values[:-1]):
-            self.head = Node(val, nxt=self.head)
-            self.nodemap[val] = self.head
-        last.next = self.head
-
-    def remove(self, node: Node):
-        if node == self.head:
-            self.head = self.head.next
-        pointer = self.head
-        while pointer.next != node:
-            pointer = pointer.next
-        pointer.next = node.next
-
-    @staticmethod
-    def get_values_after(node: Node, count: int) -> List[int]:
-        values: List[int] = []
-        for i in range(count):
-            values.append(node.next.value)
-            node = node.next
-        return values
-
-    @staticmethod
-    def move_tail(src: Node, dst: Node, count: int) -> None:
-        first = src.next
-        last = first
-        for i in range(count-1):
-            last = last.next
-        src.next = last.next
-        last.next = dst.next
-        dst.next = first
-
-    def move_head(self, node: Node) -> None:
-        self.head = node
-
-    def search(self, value: int) -> Node:
-        return self.nodemap[value]
-
-    def __str__(self):
-        output = f"{self.head.value}"
-        node = self.head.next
-        while node != self.head:
-            output += f"{node.value}"
-            node = node.next
-        return output
+# Cups linked at once when filling the successor table
+LINK_CHUNK = 1 << 20
+# Number of cups in the puzzle input
+STARTER_CUPS = 9
 
 
 @SolverFactory.register(day=23)
 class SolverDay23(PuzzleSolver):
+    independent_parts = True
+    parameters = ("moves_1", "cups_2", "moves_2")
+    moves_1: int = 100
+    cups_2: int = 1000000
+    moves_2: int = 10000000
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
 
+    @classmethod
+    def parameter_minimum(cls, name: str) -> int:
+        # Part two adds cups to the starter cups, no moves is a valid game
+        return STARTER_CUPS if name == "cups_2" else 0
+
     @property
     def demo_result_1(self) -> Optional[str]:
-        return "67384529"
+        # Only known for the puzzle's own problem size
+        return "67384529" if self.moves_1 == 100 else None
 
     @property
     def demo_result_2(self) -> Optional[int]:
+        if (self.cups_2, self.moves_2) != (1000000, 10000000):
+            return None
         return 149245887792
 
     def _read_file(self) -> List[int]:
@@ -95,44 +49,86 @@ class SolverDay23(PuzzleSolver):
                 cups = list(map(int, line))
         return cups
 
-    @staticmethod
-    def _play_game(cups: LinkedList, rounds: int) -> LinkedList:
-        cup: Node = cups.head
-        for _ in range(rounds):
-            # Pick 3 cups after the current cup
-            picked_values: List[int] = cups.get_values_after(node=cup, count=3)
-            # Find the cup where we want to move the cups after
-            index: int = cup.value - 1
-            while index in picked_values or index < cups.minimum:
-                index = index - 1 if index > cups.minimum else cups.maximum
-            # Find the node with the given index in the list
-            target: Node = cups.search(index)
-            # Move the 3 cups from after the current cup to after the target
-            cups.move_tail(cup, target, 3)
-            # Move the head one forward
-            cup = cup.next
-        return cups
+    def _link_cups(self, successors: StateTable, starter: List[int]) -> None:
+        # The starter cups are labeled 1 to k, followed by cups k+1 to n
+        n = len(successors) - 1
+        k = len(starter)
+        for cup, successor in zip(starter, starter[1:]):
+            successors[cup] = successor
+        if n == k:
+            successors[starter[-1]] = starter[0]
+            return
+        successors[starter[-1]] = k + 1
+        typecode = table_typecode(successors)
+        for lo in range(k + 1, n, LINK_CHUNK):
+            hi = min(lo + LINK_CHUNK, n)
+            successors[lo:hi] = array(typecode, range(lo + 1, hi + 1))
+        successors[n] = starter[0]
+
+    def _play_game(
+        self, starter: List[int], n: int, moves: int
+    ) -> StateTable:
+        """Play the moves on cups labeled 1 to n, starting with the starter
+
+        The circle is a successor table, mapping each label to the label of
+        the next cup clockwise.
+        """
+        if n < len(starter):
+            raise ValueError(f"Need at least {len(starter)} cups, got {n}")
+        successors = self.state_table("successors", size=n + 1, max_value=n)
+        checkpoint = self.checkpoint_session("moves", moves=moves, cups=n)
+        scalars = checkpoint.load({"successors": successors})
+        if scalars is not None:
+            start, current = scalars["move"], scalars["current"]
+            logger.info(f"Resuming from the checkpoint at move {start}")
+        else:
+            self._link_cups(successors, starter)
+            start, current = 0, starter[0]
+        with self.progress_task("moves", total=moves) as task:
+            for chunk in task.ranges(start, moves):
+                for _ in chunk:
+                    # Pick 3 cups after the current cup
+                    first = successors[current]
+                    second = successors[first]
+                    third = successors[second]
+                    # Find the cup where we want to move the cups after
+                    target = current - 1 if current > 1 else n
+                    while (
+                        target == first or target == second or target == third
+                    ):
+                        target = target - 1 if target > 1 else n
+                    # Move the 3 cups from after the current cup to after the
+                    # target
+                    successors[current] = successors[third]
+                    successors[third] = successors[target]
+                    successors[target] = first
+                    # Move the head one forward
+                    current = successors[current]
+                if checkpoint.due():
+                    checkpoint.save(
+                        scalars={"move": chunk.stop, "current": current},
+                        tables={"successors": successors},
+                    )
+        checkpoint.clear()
+        return successors
 
     def solve_1(self) -> str:
-        cups = LinkedList(self._input_data)
-        cups = self._play_game(cups, 100)
-        # Find the cup with index 1
-        one = cups.search(1)
-        # Move head to right after 1 and remove one
-        cups.move_head(one.next)
-        cups.remove(one)
-        # Return string representation of the list
-        return str(cups)
+        starter = self._input_data
+        successors = self._play_game(starter, len(starter), self.moves_1)
+        # Labels of the cups after the cup with label 1
+        labels: List[str] = []
+        cup = successors[1]
+        while cup != 1:
+            labels.append(str(cup))
+            cup = successors[cup]
+        return "".join(labels)
 
     def solve_2(self) -> int:
-        starter = self._input_data
-        intcups = starter + list(range(max(starter)+1, int(1e6+1)))
-        cups = LinkedList(intcups)
-        cups = self._play_game(cups, int(1e7))
-        # Find the cup with index 1
-        one = cups.search(1)
+        successors = self._play_game(
+            self._input_data, self.cups_2, self.moves_2
+        )
         # Get the 2 values after the one
-        val1 = one.next
-        val2 = val1.next
-        logger.debug(f"Needed values are {val1.value} and {val2.value}")
-        return val1.value * val2.value
+        val1 = successors[1]
+        val2 = successors[val1]
+        logger.debug(f"Needed values are {val1} and {val2}")
+        return val1 * val2
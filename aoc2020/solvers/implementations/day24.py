@@ -2,13 +2,15 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, cached_step
 
 logger = logging.getLogger("SolverDay24")
 
 
 @SolverFactory.register(day=24)
 class SolverDay24(PuzzleSolver):
+    independent_parts = True
+
     def __init__(self, input_file: Path):
         super().__init__(input_file=input_file)
         self.steps: Dict[str, Tuple[int, int]] = {
@@ -48,6 +50,7 @@ class SolverDay24(PuzzleSolver):
             pos = (pos[0]+direction[0], pos[1]+direction[1])
         return pos
 
+    @cached_step
     def _get_black_tiles(self) -> Set[Tuple[int, int]]:
         blacks: Set[Tuple[int, int]] = set()
         for steps in self._input_data:
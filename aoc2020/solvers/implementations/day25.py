@@ -41,12 +41,16 @@ class SolverDay25(PuzzleSolver):
 
     def _get_loopsize(self, key: int, subject_nr: int) -> int:
         value = 1
-        loop_size = 0
-        while True:
-            loop_size += 1
-            value = (value * subject_nr) % self._divisor
-            if value == key:
-                return loop_size
+        # The values cycle within the divisor, total is an upper bound
+        with self.progress_task("loop size", total=self._divisor) as task:
+            for chunk in task.ranges(1, self._divisor):
+                for loop_size in chunk:
+                    value = (value * subject_nr) % self._divisor
+                    if value == key:
+                        task.update(loop_size)
+                        return loop_size
+        logger.error(f"Key {key} is not a power of {subject_nr}")
+        return 0
 
     def solve_1(self) -> int:
         subject_nr = 7
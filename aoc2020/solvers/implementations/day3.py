@@ -4,9 +4,10 @@ from typing import Optional
 
 import numpy as np
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, trace_channel
 
 logger = logging.getLogger("SolverDay3")
+trace_slopes = trace_channel("SolverDay3", "slopes")
 
 
 @SolverFactory.register(day=3)
@@ -40,9 +41,11 @@ class SolverDay3(PuzzleSolver):
         for i, row in enumerate(range(0, n_rows, down)):
             col = (i * right) % n_cols
             trees += self._input_data[row, col]
-        logger.debug(
-            f"Number of trees for slope {right} right, {down }down: {trees}"
-        )
+        if trace_slopes.enabled:
+            trace_slopes(
+                "Number of trees for slope %d right, %d down: %d",
+                right, down, trees,
+            )
         return trees
 
     def solve_1(self) -> int:
@@ -1,11 +1,12 @@
 import logging
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, trace_channel
 
 logger = logging.getLogger("SolverDay5")
+trace_seats = trace_channel("SolverDay5", "seats")
 
 
 @SolverFactory.register(day=5)
@@ -29,7 +30,8 @@ class SolverDay5(PuzzleSolver):
             if re.fullmatch(pattern, line) is not None:
                 binary = line.replace("F", "0").replace("B", "1").replace("L", "0").replace("R", "1")
                 seat_id = int(binary, 2)
-                logger.debug(f"Decoded seat ID is {seat_id}")
+                if trace_seats.enabled:
+                    trace_seats("Decoded seat ID is %d", seat_id)
                 seat_ids.append(seat_id)
             else:
                 logger.error(f"Invalid pass detected: {line}")
@@ -38,15 +40,29 @@ class SolverDay5(PuzzleSolver):
     def solve_1(self) -> int:
         return max(self._input_data)
 
-    def solve_2(self) -> int:
-        max_id = max(self._input_data)
+    @staticmethod
+    def _find_seat(max_id: int, taken_seats: Set[int]) -> int:
         # Get all seat numbers
         all_seats = set(range(max_id+1))
         # Get missing seat numbers
-        missing_seats = all_seats - set(self._input_data)
+        missing_seats = all_seats - taken_seats
         # Find missing seat for which adjacent seats are not missing
         for seat in missing_seats:
             if seat-1 not in missing_seats and seat+1 not in missing_seats:
                 return seat
         logger.error(f"No solution found")
         return 0
+
+    def solve_2(self) -> int:
+        max_id = max(self._input_data)
+        return self._find_seat(max_id=max_id, taken_seats=set(self._input_data))
+
+    def solve_both(self) -> Tuple[int, int]:
+        # Collect the maximum and the taken seats in a single pass
+        max_id = 0
+        taken_seats: Set[int] = set()
+        for seat_id in self._input_data:
+            if seat_id > max_id:
+                max_id = seat_id
+            taken_seats.add(seat_id)
+        return max_id, self._find_seat(max_id=max_id, taken_seats=taken_seats)
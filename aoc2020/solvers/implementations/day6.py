@@ -1,10 +1,11 @@
 import logging
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, trace_channel
 
 logger = logging.getLogger("SolverDay6")
+trace_groups = trace_channel("SolverDay6", "groups")
 
 
 @SolverFactory.register(day=6)
@@ -38,27 +39,35 @@ class SolverDay6(PuzzleSolver):
                 groups.append(cur_group)
         return groups
 
+    @staticmethod
+    def _group_counts(group: List[Set[str]]) -> Tuple[int, int]:
+        # Build the union and the intersection of the group together
+        uniques: Set[str] = set()
+        commons: Optional[Set[str]] = None
+        for person in group:
+            uniques.update(person)
+            commons = person if commons is None else commons & person
+        unique_count = len(uniques)
+        common_count = len(commons) if commons else 0
+        if trace_groups.enabled:
+            trace_groups(
+                "Unique count in current group: %d, common count: %d",
+                unique_count,
+                common_count,
+            )
+        return unique_count, common_count
+
     def solve_1(self) -> int:
-        tot_count = 0
-        for group in self._input_data:
-            uniques = set()
-            for person in group:
-                uniques.update(person)
-            count = len(uniques)
-            logger.debug(f"Unique count in current group: {count}")
-            tot_count += count
-        return tot_count
+        return sum(self._group_counts(group)[0] for group in self._input_data)
 
     def solve_2(self) -> int:
-        tot_count = 0
+        return sum(self._group_counts(group)[1] for group in self._input_data)
+
+    def solve_both(self) -> Tuple[int, int]:
+        tot_uniques = 0
+        tot_commons = 0
         for group in self._input_data:
-            commons = None
-            for person in group:
-                if commons is None:
-                    commons = person
-                else:
-                    commons = commons.intersection(person)
-            count = len(commons) if commons else 0
-            logger.debug(f"Common count in current group: {count}")
-            tot_count += count
-        return tot_count
+            unique_count, common_count = self._group_counts(group)
+            tot_uniques += unique_count
+            tot_commons += common_count
+        return tot_uniques, tot_commons
@@ -3,9 +3,10 @@ import re
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, trace_channel
 
 logger = logging.getLogger("SolverDay7")
+trace_bags = trace_channel("SolverDay7", "bags")
 
 
 @SolverFactory.register(day=7)
@@ -85,7 +86,10 @@ class SolverDay7(PuzzleSolver):
         for bag_type in self._input_data:
             if self._can_contain(bag=bag_type, content=content):
                 count += 1
-                logger.debug(f"Bag type {bag_type} can contain a {content}")
+                if trace_bags.enabled:
+                    trace_bags(
+                        "Bag type %s can contain a %s", bag_type, content
+                    )
         return count
 
     def solve_2(self) -> int:
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from aoc2020.solvers import PuzzleSolver, SolverFactory
 
@@ -51,7 +51,8 @@ class SolverDay8(PuzzleSolver):
             raise ValueError(f"Invalid instruction {instruction}")
 
     def _run_program(self) -> bool:
-        visited_indices = set()
+        self.metrics.incr("program_runs")
+        visited_indices: Set[int] = set()
         self._accumulator = 0
         index = 0
         while True:
@@ -59,10 +60,12 @@ class SolverDay8(PuzzleSolver):
                 break
             elif index in visited_indices:
                 logger.debug(f"Loop detected, value is {self._accumulator}")
+                self.metrics.incr("instructions", len(visited_indices))
                 return False
             else:
                 visited_indices.add(index)
                 index = self._handle_instruction(index=index)
+        self.metrics.incr("instructions", len(visited_indices))
         return True
 
     def solve_1(self) -> int:
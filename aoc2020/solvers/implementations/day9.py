@@ -3,7 +3,7 @@ from collections import deque
 from pathlib import Path
 from typing import Deque, List, Optional
 
-from aoc2020.solvers import PuzzleSolver, SolverFactory
+from aoc2020.solvers import PuzzleSolver, SolverFactory, cached_step
 
 logger = logging.getLogger("SolverDay9")
 
@@ -42,7 +42,8 @@ class SolverDay9(PuzzleSolver):
                     return True
         return False
 
-    def solve_1(self) -> int:
+    @cached_step(copy=False)
+    def _find_invalid(self) -> int:
         # Demo uses different preamble size, so check on input length
         if len(self._input_data) == 20:
             preamble_size = 5
@@ -61,8 +62,11 @@ class SolverDay9(PuzzleSolver):
         logger.error(f"No solution found to puzzle 1")
         return 0
 
+    def solve_1(self) -> int:
+        return self._find_invalid()
+
     def solve_2(self) -> int:
-        target = self.solve_1()
+        target = self._find_invalid()
         for i in range(len(self._input_data)):
             sum_values = []
             for j in range(i, len(self._input_data)):
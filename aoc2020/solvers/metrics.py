@@ -0,0 +1,86 @@
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+
+class _Timer:
+    __slots__ = ("_timers", "_name", "_start")
+
+    def __init__(self, timers: Dict[str, float], name: str):
+        self._timers = timers
+        self._name = name
+        self._start = 0.
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._timers[self._name] += time.perf_counter() - self._start
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Counters and accumulated timers for solver hot paths"""
+
+    enabled: bool = True
+
+    def __init__(self):
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.timers: Dict[str, float] = defaultdict(float)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def timer(self, name: str) -> _Timer:
+        return _Timer(self.timers, name)
+
+    def snapshot(self) -> Dict[str, float]:
+        values: Dict[str, float] = dict(self.counters)
+        for name, duration in self.timers.items():
+            values[f"{name}_ms"] = duration * 1000.
+        return values
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.timers.clear()
+
+
+class NullMetrics(Metrics):
+    """Drop-in replacement that does nothing, used when metrics are off"""
+
+    enabled: bool = False
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        pass
+
+    def timer(self, name: str) -> _NullTimer:  # type: ignore
+        return _NULL_TIMER
+
+
+NULL_METRICS = NullMetrics()
+
+
+def create_metrics(enabled: bool) -> Metrics:
+    return Metrics() if enabled else NULL_METRICS
+
+
+def format_metrics(values: Optional[Dict[str, float]]) -> str:
+    if not values:
+        return ""
+    return ", ".join(
+        f"{name}={value:.2f}" if isinstance(value, float) else f"{name}={value}"
+        for name, value in sorted(values.items())
+    )
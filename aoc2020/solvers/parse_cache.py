@@ -0,0 +1,84 @@
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from aoc2020.utils.hashing import hash_file
+from aoc2020.utils.paths import get_cache_dir
+
+if TYPE_CHECKING:
+    from aoc2020.solvers.puzzle_solver import PuzzleSolver
+
+logger = logging.getLogger("ParseCache")
+
+
+def _is_ndarray(data: Any) -> bool:
+    # Avoid importing numpy for solvers that don't use it
+    return type(data).__module__ == "numpy" and type(data).__name__ == "ndarray"
+
+
+class ParseCache:
+    """On-disk cache of the output of PuzzleSolver._read_file"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = get_cache_dir() / "parsed"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = cache_dir
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key(solver: "PuzzleSolver") -> str:
+        solver_class = type(solver)
+        parts = [
+            f"{solver_class.__module__}.{solver_class.__qualname__}",
+            str(solver_class.parser_version),
+            hash_file(solver._input_file),
+        ]
+        return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+    def load(self, key: str) -> Tuple[bool, Any]:
+        npy_file = self._cache_dir / f"{key}.npy"
+        pkl_file = self._cache_dir / f"{key}.pkl"
+        try:
+            if npy_file.is_file():
+                import numpy as np
+                return True, np.load(npy_file, allow_pickle=False)
+            if pkl_file.is_file():
+                with pkl_file.open(mode="rb") as f:
+                    return True, pickle.load(f)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            logger.warning(f"Ignoring corrupt parse cache entry {key}")
+        return False, None
+
+    def store(self, key: str, data: Any) -> None:
+        if _is_ndarray(data) and data.dtype != object:
+            import numpy as np
+            target = self._cache_dir / f"{key}.npy"
+            tmp_target = self._cache_dir / f"{key}.tmp.npy"
+            np.save(tmp_target, data, allow_pickle=False)
+        else:
+            target = self._cache_dir / f"{key}.pkl"
+            tmp_target = self._cache_dir / f"{key}.tmp.pkl"
+            try:
+                with tmp_target.open(mode="wb") as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                logger.debug(f"Parsed input for {key} cannot be cached")
+                tmp_target.unlink()
+                return
+        tmp_target.replace(target)
+
+    def get_or_parse(self, solver: "PuzzleSolver") -> Any:
+        key = self.key(solver)
+        found, data = self.load(key)
+        if found:
+            self.hits += 1
+            logger.debug(f"Parse cache hit for {type(solver).__name__}")
+            return data
+        self.misses += 1
+        data = solver._read_file()
+        self.store(key, data)
+        return data
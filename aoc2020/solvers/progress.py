@@ -0,0 +1,166 @@
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, TextIO
+
+
+@dataclass
+class ProgressUpdate:
+    name: str
+    done: int
+    total: Optional[int]
+    elapsed: float  # In seconds
+    final: bool = False
+    start: int = 0  # Iterations already done before, e.g. when resuming
+
+    @property
+    def rate(self) -> float:
+        # Iterations per second
+        if self.elapsed <= 0:
+            return 0.
+        return (self.done - self.start) / self.elapsed
+
+    @property
+    def eta(self) -> Optional[float]:
+        if self.total is None or self.rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / self.rate
+
+
+ProgressSink = Callable[[ProgressUpdate], None]
+
+
+class ProgressTask:
+    """Progress of one long-running solver loop
+
+    Loops iterate over `ranges`, which hands out chunks of `stride`
+    iterations and reports in between, so the loop body itself pays nothing.
+    Reports are rate limited to one per `interval` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        total: Optional[int],
+        sink: Optional[ProgressSink],
+        interval: float,
+        stride: int,
+    ):
+        self.name = name
+        self.total = total
+        self.stride = stride
+        self._sink = sink
+        self._interval = interval
+        self._start = time.perf_counter()
+        self._last = self._start
+        self._done = 0
+        self._offset = 0
+
+    def update(self, done: int) -> None:
+        self._done = done
+        if self._sink is None:
+            return
+        now = time.perf_counter()
+        if now - self._last < self._interval:
+            return
+        self._last = now
+        self._sink(ProgressUpdate(
+            self.name, done, self.total, now - self._start, start=self._offset
+        ))
+
+    def ranges(self, start: int, stop: int) -> Iterator[range]:
+        # Progress counts up to stop, the rate only what is done here
+        self._offset = self._done = start
+        for begin in range(start, stop, self.stride):
+            end = min(begin + self.stride, stop)
+            yield range(begin, end)
+            self.update(end)
+
+    def close(self) -> None:
+        if self._sink is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        self._sink(ProgressUpdate(
+            self.name, self._done, self.total, elapsed, True, self._offset
+        ))
+
+    def __enter__(self) -> "ProgressTask":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ProgressReporter:
+    def __init__(
+        self,
+        sink: Optional[ProgressSink] = None,
+        interval: float = 0.5,
+        stride: int = 1 << 16,
+    ):
+        self.sink = sink
+        self.interval = interval  # Minimum seconds between two reports
+        self.stride = stride  # Iterations between two checks of the clock
+
+    def task(self, name: str, total: Optional[int] = None) -> ProgressTask:
+        return ProgressTask(
+            name=name,
+            total=total,
+            sink=self.sink,
+            interval=self.interval,
+            stride=self.stride,
+        )
+
+
+# Reports nothing, loops still run in chunks of the default stride
+NULL_PROGRESS = ProgressReporter()
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "?"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m{seconds:02d}s"
+
+
+def format_progress(update: ProgressUpdate) -> str:
+    if update.total is not None and update.total > 0:
+        done = f"{update.done}/{update.total} ({update.done/update.total:.0%})"
+    else:
+        done = f"{update.done}"
+    if update.final:
+        return (
+            f"{update.name}: {done} in {_format_duration(update.elapsed)} "
+            f"({update.rate:,.0f} it/s)"
+        )
+    return (
+        f"{update.name}: {done}, {update.rate:,.0f} it/s, "
+        f"ETA {_format_duration(update.eta)}"
+    )
+
+
+class StreamSink:
+    """Writes progress to a stream, redrawing a single line on a TTY
+
+    Without a TTY, e.g. in CI logs, every report is a full line and the
+    reporter should use a long interval.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream if stream is not None else sys.stderr
+        self.tty = self.stream.isatty()
+
+    def __call__(self, update: ProgressUpdate) -> None:
+        if self.tty:
+            end = "\n" if update.final else ""
+            self.stream.write(f"\r\x1b[K{format_progress(update)}{end}")
+        else:
+            self.stream.write(f"{format_progress(update)}\n")
+        self.stream.flush()
+
+
+def stderr_progress() -> ProgressReporter:
+    sink = StreamSink()
+    return ProgressReporter(sink=sink, interval=0.5 if sink.tty else 10.)
@@ -1,12 +1,121 @@
+import functools
+import time
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from aoc2020.solvers.checkpoint import (
+    NULL_CHECKPOINT,
+    CheckpointSession,
+    CheckpointStore,
+)
+from aoc2020.solvers.metrics import Metrics, create_metrics
+from aoc2020.solvers.parse_cache import ParseCache
+from aoc2020.solvers.progress import (
+    NULL_PROGRESS,
+    ProgressReporter,
+    ProgressTask,
+    stderr_progress,
+)
+from aoc2020.solvers.state_table import StateTable, create_state_table
+from aoc2020.utils.paths import get_cache_dir
+
+T = TypeVar("T")
+
+
+@dataclass
+class StepStats:
+    hits: int = 0
+    misses: int = 0
+
+
+def cached_step(
+    method: Optional[Callable[[Any], T]] = None, *, copy: bool = True
+) -> Any:
+    """Compute a solver method without arguments once per solver instance
+
+    Every call returns a deep copy of the cached result, so callers are free
+    to mutate it. Use copy=False for immutable results.
+    """
+    def decorator(fn: Callable[[Any], T]) -> Callable[[Any], T]:
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(self: "PuzzleSolver") -> T:
+            stats = self.step_stats.setdefault(name, StepStats())
+            if name in self._steps:
+                stats.hits += 1
+                value = self._steps[name]
+            else:
+                stats.misses += 1
+                value = fn(self)
+                self._steps[name] = value
+            return deepcopy(value) if copy else value
+
+        return wrapper
+
+    if method is not None:
+        return decorator(method)
+    return decorator
 
 
 class PuzzleSolver(ABC):
+    # Bump when the output of _read_file changes, to invalidate cached parses
+    parser_version: int = 1
+    # Opt-in on-disk cache of parsed inputs, see enable_parse_cache
+    parse_cache: Optional[ParseCache] = None
+    # Hot path counters and timers are only collected when enabled
+    collect_metrics: bool = False
+    # Progress of long-running loops, see enable_progress
+    progress: ProgressReporter = NULL_PROGRESS
+    # Opt-in checkpoints of long-running loops, see enable_checkpoints
+    checkpoints: Optional[CheckpointStore] = None
+    # Directory for memory-mapped state tables, see enable_out_of_core
+    state_dir: Optional[Path] = None
+    # Names of class attributes that set the problem size, e.g. turns
+    parameters: Tuple[str, ...] = ()
+    # Parts are worth solving at once, each in a forked copy of the solver
+    independent_parts: bool = False
+
     def __init__(self, input_file: Path):
         self._input_file = input_file
-        self._input_data = self._read_file()
+        self.metrics: Metrics = create_metrics(enabled=self.collect_metrics)
+        # Results and statistics of the methods decorated with cached_step
+        self._steps: Dict[str, Any] = {}
+        self.step_stats: Dict[str, StepStats] = {}
+        a = time.perf_counter()
+        self._input_data = self._load_input()
+        self.parse_duration: float = time.perf_counter() - a
+
+    def progress_task(
+        self, name: str, total: Optional[int] = None
+    ) -> ProgressTask:
+        return self.progress.task(f"{type(self).__name__} {name}", total)
+
+    def checkpoint_session(self, name: str, **params: Any) -> CheckpointSession:
+        # Params are everything besides the input that determines the state
+        if self.checkpoints is None:
+            return NULL_CHECKPOINT
+        return self.checkpoints.session(solver=self, name=name, params=params)
+
+    def state_table(self, name: str, size: int, max_value: int) -> StateTable:
+        return create_state_table(
+            size=size,
+            max_value=max_value,
+            directory=self.state_dir,
+            prefix=f"{type(self).__name__}-{name}-",
+        )
+
+    def reset_steps(self) -> None:
+        # Forget cached intermediate results, e.g. between benchmark rounds
+        self._steps.clear()
+
+    def _load_input(self) -> Any:
+        if self.parse_cache is None:
+            return self._read_file()
+        return self.parse_cache.get_or_parse(self)
 
     # ABSTRACT PROPERTIES
     @property
@@ -31,3 +140,45 @@ class PuzzleSolver(ABC):
     @abstractmethod
     def solve_2(self) -> Union[int, str]:
         raise NotImplementedError
+
+    # OPTIONAL FUSED SOLVER
+    def solve_both(self) -> Tuple[Union[int, str], Union[int, str]]:
+        # Override when both parts can be answered in a single pass
+        return self.solve_1(), self.solve_2()
+
+    @classmethod
+    def fuses_parts(cls) -> bool:
+        return cls.solve_both is not PuzzleSolver.solve_both
+
+    @classmethod
+    def parameter_minimum(cls, name: str) -> int:
+        # Smallest value of a parameter the solver can handle
+        return 1
+
+
+def enable_progress(
+    reporter: Optional[ProgressReporter] = None
+) -> ProgressReporter:
+    PuzzleSolver.progress = reporter or stderr_progress()
+    return PuzzleSolver.progress
+
+
+def enable_checkpoints(
+    interval: float = 30., cache_dir: Optional[Path] = None
+) -> CheckpointStore:
+    PuzzleSolver.checkpoints = CheckpointStore(
+        cache_dir=cache_dir, interval=interval
+    )
+    return PuzzleSolver.checkpoints
+
+
+def enable_out_of_core(state_dir: Optional[Path] = None) -> Path:
+    if state_dir is None:
+        state_dir = get_cache_dir() / "state"
+    PuzzleSolver.state_dir = state_dir
+    return state_dir
+
+
+def enable_parse_cache(cache_dir: Optional[Path] = None) -> ParseCache:
+    PuzzleSolver.parse_cache = ParseCache(cache_dir=cache_dir)
+    return PuzzleSolver.parse_cache
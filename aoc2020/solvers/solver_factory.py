@@ -1,22 +1,54 @@
+import importlib
 import logging
 from pathlib import Path
-from typing import Dict, Type
+from typing import Any, Dict, List, Optional, Type
 
+from aoc2020.solvers.implementations import SOLVER_MODULES
 from aoc2020.solvers.puzzle_solver import PuzzleSolver
 
 logger = logging.getLogger("SolverFactory")
 
+ENTRY_POINT_GROUP = "aoc2020.solvers"
+
 
 class SolverFactory:
+    # Imported solver classes, filled by the register decorator
     registry: Dict[int, Type[PuzzleSolver]] = {}
+    # Built-in solver modules, only imported on first use
+    modules: Dict[int, str] = dict(SOLVER_MODULES)
+    # Third-party solvers from entry points, only discovered when needed
+    _plugins: Optional[Dict[int, Any]] = None
 
     @classmethod
     def create_solver(cls, day: int, input_file: Path) -> PuzzleSolver:
+        solver_class = cls.get_solver_class(day=day)
+        return solver_class(input_file=input_file)
+
+    @classmethod
+    def get_solver_class(cls, day: int) -> Type[PuzzleSolver]:
+        # Registered solvers take precedence over built-ins and plugins
+        if day not in cls.registry:
+            if day in cls.modules:
+                importlib.import_module(cls.modules[day])
+            elif day in cls._discover_plugins():
+                cls._load_plugin(day=day)
         if day not in cls.registry:
             raise ValueError(f"No solver registered for day {day}")
+        return cls.registry[day]
 
-        solver_class = cls.registry[day]
-        return solver_class(input_file=input_file)
+    @classmethod
+    def has_solver(cls, day: int) -> bool:
+        return (
+            day in cls.registry
+            or day in cls.modules
+            or day in cls._discover_plugins()
+        )
+
+    @classmethod
+    def available_days(cls) -> List[int]:
+        return sorted(
+            set(cls.registry) | set(cls.modules) | set(cls._discover_plugins())
+        )
 
     @classmethod
     def register(cls, day: int):
@@ -30,3 +62,35 @@ class SolverFactory:
             return solver_class
 
         return wrapper
+
+    @classmethod
+    def _discover_plugins(cls) -> Dict[int, Any]:
+        if cls._plugins is not None:
+            return cls._plugins
+        cls._plugins = {}
+        try:
+            # Imported here, scanning installed distributions is slow
+            from importlib.metadata import entry_points
+        except ImportError:
+            logger.debug(f"importlib.metadata not available, no plugins")
+            return cls._plugins
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            group = eps.select(group=ENTRY_POINT_GROUP)
+        else:
+            group = eps.get(ENTRY_POINT_GROUP, [])  # type: ignore
+        for ep in group:
+            try:
+                cls._plugins[int(ep.name)] = ep
+            except ValueError:
+                logger.warning(f"Ignoring solver entry point {ep.name}")
+        return cls._plugins
+
+    @classmethod
+    def _load_plugin(cls, day: int) -> None:
+        # Entry points refer to a module using the register decorator, or
+        #  directly to the solver class
+        loaded = cls._discover_plugins()[day].load()
+        if day not in cls.registry and isinstance(loaded, type) \
+                and issubclass(loaded, PuzzleSolver):
+            cls.registry[day] = loaded
@@ -0,0 +1,44 @@
+import mmap
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Optional, Union
+
+# Both support len, indexing, slice assignment and the buffer protocol
+StateTable = Union[array, memoryview]
+
+
+def _typecode(max_value: int) -> str:
+    return "I" if max_value < 1 << 32 else "Q"
+
+
+def table_typecode(table: StateTable) -> str:
+    return table.typecode if isinstance(table, array) else table.format
+
+
+def create_state_table(
+    size: int,
+    max_value: int,
+    directory: Optional[Path] = None,
+    prefix: str = "state-",
+) -> StateTable:
+    """Zero-filled table of `size` fixed-width unsigned integers
+
+    Without a directory the table is an array.array in memory. With one it
+    is a memory-mapped file, so it may exceed RAM and is only bounded by the
+    page cache. The file is unlinked right away and disappears together with
+    the table.
+    """
+    typecode = _typecode(max_value)
+    if directory is None:
+        # Repeating a single zero never allocates more than the table
+        return array(typecode, [0]) * size
+    directory.mkdir(parents=True, exist_ok=True)
+    nbytes = max(size, 1) * array(typecode).itemsize
+    with tempfile.TemporaryFile(dir=directory, prefix=prefix) as f:
+        # Sparse, the file system zero-fills pages on first access
+        f.truncate(nbytes)
+        mapped = mmap.mmap(f.fileno(), nbytes)
+    view = memoryview(mapped)
+    table = view.cast("I") if typecode == "I" else view.cast("Q")
+    return table[:size]
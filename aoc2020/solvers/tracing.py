@@ -0,0 +1,76 @@
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+# AOC2020_TRACE=0 at import time disables tracing for good: every channel
+# stays off and configure_tracing has no effect
+TRACING_AVAILABLE: bool = os.environ.get("AOC2020_TRACE", "1") != "0"
+
+
+class TraceChannel:
+    """Debug messages of one category of one solver
+
+    Hot loops guard calls with `if channel.enabled:`, so a disabled channel
+    costs an attribute lookup and no call or argument formatting. Messages
+    use %-style arguments, formatted only when the message is emitted.
+    """
+
+    __slots__ = ("solver", "category", "enabled", "_logger")
+
+    def __init__(self, solver: str, category: str):
+        self.solver = solver
+        self.category = category
+        self.enabled = False
+        self._logger = logging.getLogger(solver)
+
+    def __call__(self, msg: str, *args: Any) -> None:
+        if self.enabled:
+            self._logger.debug(f"[{self.category}] {msg}", *args)
+
+
+_CHANNELS: Dict[Tuple[str, str], TraceChannel] = {}
+# Enabled (solver, category) patterns, either part may be "*"
+_PATTERNS: List[Tuple[str, str]] = []
+
+
+def _update(channel: TraceChannel) -> None:
+    channel.enabled = TRACING_AVAILABLE and any(
+        solver in ("*", channel.solver) and category in ("*", channel.category)
+        for solver, category in _PATTERNS
+    )
+    if channel.enabled:
+        # Traces are debug messages, the solver logger has to let them pass
+        channel._logger.setLevel(logging.DEBUG)
+
+
+def trace_channel(solver: str, category: str) -> TraceChannel:
+    key = (solver, category)
+    if key not in _CHANNELS:
+        # Solver modules are imported lazily, possibly after configuring
+        channel = TraceChannel(solver=solver, category=category)
+        _update(channel)
+        _CHANNELS[key] = channel
+    return _CHANNELS[key]
+
+
+def parse_trace_spec(spec: str) -> List[Tuple[str, str]]:
+    """Parse 'SolverDay5:seats,SolverDay7' like specs, '*' matches all"""
+    patterns = []
+    for item in spec.split(","):
+        item = item.strip()
+        if len(item) == 0:
+            continue
+        solver, _, category = item.partition(":")
+        patterns.append((solver or "*", category or "*"))
+    return patterns
+
+
+def configure_tracing(spec: str) -> None:
+    if not TRACING_AVAILABLE:
+        logging.getLogger("Tracing").warning(
+            f"Tracing was disabled with AOC2020_TRACE=0"
+        )
+        return
+    _PATTERNS[:] = parse_trace_spec(spec)
+    for channel in _CHANNELS.values():
+        _update(channel)
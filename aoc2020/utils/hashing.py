@@ -0,0 +1,10 @@
+import hashlib
+from pathlib import Path
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open(mode="rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
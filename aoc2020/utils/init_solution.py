@@ -1,11 +1,12 @@
 import argparse
 import logging
-import pkg_resources
 from pathlib import Path
 
 import mako.exceptions
 import mako.template
 
+from aoc2020.utils.resources import resource_path
+
 logger = logging.getLogger("InitSolver")
 
 
@@ -37,7 +38,7 @@ def init_solution(data_folder: Path, solver_folder: Path, day: int):
         logger.error(f"The solver file '{str(script_file)}' already exists")
         return
 
-    template_path = pkg_resources.resource_filename(__package__, "dayx.mako")
+    template_path = str(resource_path(__package__, "dayx.mako"))
     # Load the template
     try:
         t = mako.template.Template(filename=template_path)
@@ -53,18 +54,13 @@ def init_solution(data_folder: Path, solver_folder: Path, day: int):
     with script_file.open(mode="w") as f:
         f.write(rendered)
 
-    # Add import statements to the init file
+    # Add the solver module to the lazy module mapping in the init file
     IMPORT_PH1 = "# IMPORT_PH1"
-    IMPORT_PH2 = "# IMPORT_PH2"
     with init_file.open(mode="r") as f:
         content = f.read()
     content = content.replace(
         IMPORT_PH1,
-        f"from .day{day} import SolverDay{day}\n{IMPORT_PH1}"
-    )
-    content = content.replace(
-        IMPORT_PH2,
-        f"\"SolverDay{day}\",\n    {IMPORT_PH2}"
+        f"{day}: \"aoc2020.solvers.implementations.day{day}\",\n    {IMPORT_PH1}"
     )
     with init_file.open(mode="w") as f:
         f.write(content)
@@ -0,0 +1,15 @@
+import os
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    # Explicit override first, then the XDG cache location
+    override = os.environ.get("AOC2020_CACHE_DIR")
+    if override:
+        cache_dir = Path(override)
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        cache_dir = base / "aoc2020"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
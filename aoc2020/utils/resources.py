@@ -0,0 +1,48 @@
+import hashlib
+import importlib
+from pathlib import Path
+from typing import Optional
+
+from aoc2020.utils.paths import get_cache_dir
+
+
+def _filesystem_path(package: str, resource: str) -> Optional[Path]:
+    # Regular installs: the resource lives next to the package modules
+    module = importlib.import_module(package)
+    spec = module.__spec__
+    locations = spec.submodule_search_locations if spec is not None else None
+    for location in locations or []:
+        candidate = Path(location) / resource
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def read_resource(package: str, resource: str) -> bytes:
+    path = _filesystem_path(package=package, resource=resource)
+    if path is not None:
+        return path.read_bytes()
+    # Zipped installs, only then pay for importing importlib.resources
+    import importlib.resources as importlib_resources
+    if hasattr(importlib_resources, "files"):
+        ref = importlib_resources.files(package).joinpath(resource)
+        return ref.read_bytes()
+    package_part, _, name = f"{package}/{resource}".rpartition("/")
+    return importlib_resources.read_binary(package_part.replace("/", "."), name)
+
+
+def resource_path(package: str, resource: str) -> Path:
+    """Filesystem path of a package resource, extracted when zipped"""
+    path = _filesystem_path(package=package, resource=resource)
+    if path is not None:
+        return path
+    content = read_resource(package=package, resource=resource)
+    # Keyed on content, so an updated install never serves stale files
+    digest = hashlib.sha256(content).hexdigest()[:16]
+    target = get_cache_dir() / "resources" / digest / Path(resource).name
+    if not target.is_file():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_suffix(target.suffix + ".tmp")
+        tmp_target.write_bytes(content)
+        tmp_target.replace(target)
+    return target
@@ -0,0 +1,50 @@
+import os
+import platform
+import resource
+import socket
+import sys
+from typing import Dict, Optional, Union
+
+
+def max_rss() -> int:
+    """High-water mark of the resident set size of this process in bytes"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Restart the resident set high-water mark at the current size
+
+    Only Linux can do this, max_rss never goes down. Returns whether
+    peak_rss measures from here on.
+    """
+    try:
+        with open("/proc/self/clear_refs", mode="w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss() -> Optional[int]:
+    """High-water mark of the resident set size since reset_peak_rss"""
+    try:
+        with open("/proc/self/status", mode="r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def host_info() -> Dict[str, Union[str, int]]:
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cpu_count": os.cpu_count() or 1,
+    }
@@ -25,6 +25,7 @@ setuptools.setup(
     entry_points={
         'console_scripts': [
             'aoc2020-solver=aoc2020.solve:main',
+            'aoc2020-bench=aoc2020.bench:main',
             'aoc2020-init=aoc2020.utils.init_solution:main',
         ],
     },
@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from aoc2020.data import DataFactory
+from aoc2020.solvers import SolverFactory
+from aoc2020.solvers.checkpoint import CheckpointSession, CheckpointStore
+from aoc2020.solvers.progress import ProgressReporter, ProgressUpdate
+from aoc2020.solvers.state_table import create_state_table
+
+
+@pytest.fixture
+def session(tmp_path: Path) -> CheckpointSession:
+    return CheckpointSession(path=tmp_path / "loop.ckpt", interval=0.)
+
+
+def test_round_trip(session: CheckpointSession):
+    small = create_state_table(size=5, max_value=100)
+    large = create_state_table(size=3, max_value=1 << 40)
+    for i in range(5):
+        small[i] = i * 10
+    large[2] = 1 << 40
+    session.save({"turn": 7, "value": 3}, {"small": small, "large": large})
+
+    small_copy = create_state_table(size=5, max_value=100)
+    large_copy = create_state_table(size=3, max_value=1 << 40)
+    scalars = session.load({"small": small_copy, "large": large_copy})
+    assert scalars == {"turn": 7, "value": 3}
+    assert list(small_copy) == [0, 10, 20, 30, 40]
+    assert list(large_copy) == [0, 0, 1 << 40]
+
+
+def test_round_trip_memory_mapped(session: CheckpointSession, tmp_path: Path):
+    table = create_state_table(size=4, max_value=9, directory=tmp_path)
+    table[3] = 9
+    session.save({"turn": 1}, {"table": table})
+    restored = create_state_table(size=4, max_value=9, directory=tmp_path)
+    assert session.load({"table": restored}) == {"turn": 1}
+    assert list(restored) == [0, 0, 0, 9]
+
+
+def test_missing_checkpoint(session: CheckpointSession):
+    assert session.load({}) is None
+
+
+def test_save_leaves_no_temporary_file(session: CheckpointSession):
+    session.save({"turn": 1}, {"table": create_state_table(4, 9)})
+    session.save({"turn": 2}, {"table": create_state_table(4, 9)})
+    assert [path.name for path in session.path.parent.iterdir()] == [
+        "loop.ckpt"
+    ]
+
+
+def test_clear(session: CheckpointSession):
+    session.save({"turn": 1}, {})
+    session.clear()
+    assert not session.path.exists()
+    session.clear()
+
+
+def test_bad_magic_is_ignored(session: CheckpointSession):
+    session.path.write_bytes(b"NOTACKPT" + b"\0" * 16)
+    assert session.load({}) is None
+
+
+def test_truncated_checkpoint_leaves_tables_untouched(
+    session: CheckpointSession
+):
+    table = create_state_table(size=4, max_value=9)
+    table[0] = 5
+    session.save({"turn": 1}, {"table": table})
+    session.path.write_bytes(session.path.read_bytes()[:-1])
+    restored = create_state_table(size=4, max_value=9)
+    restored[1] = 7
+    assert session.load({"table": restored}) is None
+    assert list(restored) == [0, 7, 0, 0]
+
+
+def test_mismatching_table_is_ignored(session: CheckpointSession):
+    session.save({"turn": 1}, {"table": create_state_table(4, 9)})
+    assert session.load({"table": create_state_table(5, 9)}) is None
+    assert session.load({"table": create_state_table(4, 1 << 40)}) is None
+    assert session.load({"other": create_state_table(4, 9)}) is None
+
+
+def test_store_keys_on_params(tmp_path: Path):
+    store = CheckpointStore(cache_dir=tmp_path, interval=0.)
+    solver = SolverFactory.create_solver(
+        day=15, input_file=DataFactory.get_demo_file(day=15)
+    )
+    first = store.session(solver, name="turns", params={"turn": 10})
+    second = store.session(solver, name="turns", params={"turn": 20})
+    assert first.path != second.path
+    assert first.path.parent == tmp_path
+
+
+class Interrupt(Exception):
+    pass
+
+
+def test_interrupted_loop_resumes(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    turn = 300000
+    demo_file = DataFactory.get_demo_file(day=15)
+    expected = SolverFactory.create_solver(day=15, input_file=demo_file)
+    answer = expected._find_value(turn=turn)
+
+    def interrupt(update: ProgressUpdate) -> None:
+        # Reported after the checkpoint of the second chunk was saved
+        if update.done >= 2 * (1 << 16) and not update.final:
+            raise Interrupt
+
+    store = CheckpointStore(cache_dir=tmp_path, interval=0.)
+    killed = SolverFactory.create_solver(day=15, input_file=demo_file)
+    killed.checkpoints = store
+    killed.progress = ProgressReporter(sink=interrupt, interval=0.)
+    with pytest.raises(Interrupt):
+        killed._find_value(turn=turn)
+    assert len(list(tmp_path.glob("*.ckpt"))) == 1
+
+    resumed = SolverFactory.create_solver(day=15, input_file=demo_file)
+    resumed.checkpoints = store
+    with caplog.at_level(logging.INFO, logger="SolverDay15"):
+        assert resumed._find_value(turn=turn) == answer
+    assert "Resuming from the checkpoint" in caplog.text
+    # A finished loop leaves nothing to resume
+    assert list(tmp_path.glob("*.ckpt")) == []
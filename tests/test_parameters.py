@@ -0,0 +1,55 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from aoc2020.data import DataFactory
+from aoc2020.runner import TimingHistory, run_parallel
+from aoc2020.solve import apply_parameters
+from aoc2020.solvers import SolverFactory
+
+
+@pytest.fixture(autouse=True)
+def restore_parameters(monkeypatch: pytest.MonkeyPatch):
+    # Parameters are class attributes, restored after each test
+    for day in [15, 23]:
+        solver_class = SolverFactory.get_solver_class(day=day)
+        for name in solver_class.parameters:
+            monkeypatch.setattr(
+                solver_class, name, getattr(solver_class, name)
+            )
+
+
+def test_parameter_is_set():
+    apply_parameters(days=[15, 23], params=["cups_2=20", "moves_1=0"])
+    day23 = SolverFactory.get_solver_class(day=23)
+    assert (day23.cups_2, day23.moves_1) == (20, 0)
+
+
+@pytest.mark.parametrize(
+    "param", ["cups_2=8", "moves_2=-1", "cups_2=x", "turns_1=5", "size=1"]
+)
+def test_invalid_parameter_is_rejected(param: str):
+    with pytest.raises(ValueError):
+        apply_parameters(days=[23], params=[param])
+    assert SolverFactory.get_solver_class(day=23).cups_2 == 1000000
+
+
+def test_parameters_reach_spawned_workers(tmp_path: Path):
+    apply_parameters(days=[15], params=["turns_1=10"])
+    solver = SolverFactory.create_solver(
+        day=15, input_file=DataFactory.get_demo_file(day=15)
+    )
+    method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method("spawn", force=True)
+    try:
+        results = run_parallel(
+            days=[15],
+            demo_only=True,
+            jobs=1,
+            history=TimingHistory(path=tmp_path / "timings.json"),
+        )
+    finally:
+        multiprocessing.set_start_method(method, force=True)
+    assert results[0].demo.parts[0].solution == solver.solve_1()
+    assert results[0].demo.parts[0].expected is None
@@ -0,0 +1,115 @@
+import inspect
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from aoc2020.runner import PartResult, ResultCache
+from aoc2020.solvers import PuzzleSolver
+
+
+class SizedSolver(PuzzleSolver):
+    parameters = ("size",)
+    size: int = 10
+
+    @property
+    def demo_result_1(self) -> Optional[int]:
+        return None
+
+    @property
+    def demo_result_2(self) -> Optional[int]:
+        return None
+
+    def _read_file(self) -> str:
+        return self._input_file.read_text()
+
+    def solve_1(self) -> int:
+        return len(self._input_data)
+
+    def solve_2(self) -> int:
+        return self.size
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResultCache:
+    return ResultCache(cache_dir=tmp_path / "results")
+
+
+def test_round_trip(cache: ResultCache, input_file: Path):
+    key = cache.key(SizedSolver(input_file=input_file), day=1, part=1)
+    cache.store(key, PartResult(part=1, solution=6, duration=0.5))
+    loaded = cache.load(key)
+    assert loaded is not None
+    assert (loaded.part, loaded.solution, loaded.duration) == (1, 6, 0.5)
+    assert loaded.cached
+
+
+def test_key_depends_on_day_and_part(input_file: Path):
+    solver = SizedSolver(input_file=input_file)
+    keys = {
+        ResultCache.key(solver, day=day, part=part)
+        for day in (1, 2) for part in (1, 2)
+    }
+    assert len(keys) == 4
+
+
+def test_changed_input_invalidates(cache: ResultCache, input_file: Path):
+    key = cache.key(SizedSolver(input_file=input_file), day=1, part=1)
+    cache.store(key, PartResult(part=1, solution=6, duration=0.5))
+    input_file.write_text("1\n2\n")
+    new_key = cache.key(SizedSolver(input_file=input_file), day=1, part=1)
+    assert new_key != key
+    assert cache.load(new_key) is None
+
+
+def test_changed_parameter_invalidates(input_file: Path):
+    solver = SizedSolver(input_file=input_file)
+    key = ResultCache.key(solver, day=1, part=2)
+    solver.size = 20
+    assert ResultCache.key(solver, day=1, part=2) != key
+
+
+def test_changed_source_invalidates(
+    input_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    source = tmp_path / "solver.py"
+    source.write_text("def solve(): return 1\n")
+    monkeypatch.setattr(inspect, "getsourcefile", lambda obj: str(source))
+    solver = SizedSolver(input_file=input_file)
+    key = ResultCache.key(solver, day=1, part=1)
+    source.write_text("def solve(): return 2\n")
+    assert ResultCache.key(solver, day=1, part=1) != key
+
+
+def test_without_source_nothing_is_cached(
+    input_file: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(inspect, "getsourcefile", lambda obj: None)
+    solver = SizedSolver(input_file=input_file)
+    assert ResultCache.key(solver, day=1, part=1) is None
+
+
+def test_not_read_when_disabled(tmp_path: Path, input_file: Path):
+    writer = ResultCache(cache_dir=tmp_path / "results")
+    key = writer.key(SizedSolver(input_file=input_file), day=1, part=1)
+    writer.store(key, PartResult(part=1, solution=6, duration=0.5))
+    reader = ResultCache(cache_dir=tmp_path / "results", read=False)
+    assert reader.load(key) is None
+
+
+def test_corrupt_entry_is_ignored(cache: ResultCache, tmp_path: Path):
+    (tmp_path / "results" / "abc.json").write_text("{not json")
+    assert cache.load("abc") is None
+
+
+def test_unfinished_part_is_not_stored(cache: ResultCache, tmp_path: Path):
+    cache.store("abc", PartResult(part=1, solution=None, duration=1.))
+    assert cache.load("abc") is None
+    assert list((tmp_path / "results").iterdir()) == []
@@ -0,0 +1,127 @@
+import faulthandler
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Optional
+
+from aoc2020.runner import (
+    ResultCache,
+    SandboxLimits,
+    run_sandboxed,
+    run_sandboxed_all,
+    run_solver,
+)
+from aoc2020.solvers import PuzzleSolver
+
+
+def test_value_is_returned():
+    outcome = run_sandboxed(lambda: 42, SandboxLimits(timeout=10.))
+    assert (outcome.status, outcome.value) == ("OK", 42)
+
+
+def test_runs_in_a_child_process():
+    outcome = run_sandboxed(os.getpid, SandboxLimits())
+    assert outcome.value != os.getpid()
+
+
+def test_timeout():
+    a = time.perf_counter()
+    outcome = run_sandboxed(lambda: time.sleep(30), SandboxLimits(timeout=.2))
+    assert outcome.status == "TIMEOUT"
+    assert time.perf_counter() - a < 10.
+    assert outcome.duration >= .2
+
+
+def test_memory_limit():
+    outcome = run_sandboxed(
+        lambda: len(bytearray(4 << 30)), SandboxLimits(memory=512 << 20)
+    )
+    assert outcome.status == "OOM"
+
+
+def test_exception():
+    outcome = run_sandboxed(lambda: 1 // 0, SandboxLimits())
+    assert outcome.status == "ERROR"
+    assert "ZeroDivisionError" in outcome.detail
+
+
+def test_crash_without_memory_limit():
+    outcome = run_sandboxed(lambda: os._exit(3), SandboxLimits())
+    assert (outcome.status, outcome.detail) == ("ERROR", "exit code 3")
+
+
+def test_exit_under_memory_limit_is_no_oom():
+    limits = SandboxLimits(memory=1 << 30)
+    outcome = run_sandboxed(lambda: os._exit(3), limits)
+    assert (outcome.status, outcome.detail) == ("ERROR", "exit code 3")
+
+
+def test_native_crash_under_memory_limit():
+    def crash() -> None:
+        # pytest would dump the stack of the child
+        faulthandler.disable()
+        os.kill(os.getpid(), signal.SIGSEGV)
+
+    assert run_sandboxed(crash, SandboxLimits()).status == "ERROR"
+    outcome = run_sandboxed(crash, SandboxLimits(memory=1 << 30))
+    assert outcome.status == "OOM"
+    assert "SIGSEGV" in outcome.detail
+
+
+def test_unpicklable_result():
+    outcome = run_sandboxed(
+        lambda: lambda: None, SandboxLimits(memory=1 << 30)
+    )
+    assert outcome.status == "ERROR"
+    assert "Cannot send the result" in outcome.detail
+
+
+def test_children_run_at_the_same_time():
+    outcomes = run_sandboxed_all(
+        [lambda: time.sleep(.3), lambda: time.sleep(30), lambda: 1],
+        SandboxLimits(timeout=1.),
+    )
+    assert [outcome.status for outcome in outcomes] == [
+        "OK", "TIMEOUT", "OK"
+    ]
+    assert outcomes[2].duration < outcomes[0].duration
+
+
+class SlowSolver(PuzzleSolver):
+    @property
+    def demo_result_1(self) -> Optional[int]:
+        return None
+
+    @property
+    def demo_result_2(self) -> Optional[int]:
+        return None
+
+    def _read_file(self) -> str:
+        return self._input_file.read_text()
+
+    def solve_1(self) -> int:
+        return len(self._input_data)
+
+    def solve_2(self) -> int:
+        time.sleep(30)
+        return 0
+
+
+def test_timed_out_part_is_reported_and_not_cached(tmp_path: Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("abc")
+    cache = ResultCache(cache_dir=tmp_path / "results")
+    result = run_solver(
+        SlowSolver(input_file=input_file),
+        is_test=False,
+        day=1,
+        cache=cache,
+        limits=SandboxLimits(timeout=.5),
+    )
+    first, second = result.parts
+    assert (first.status, first.solution) == ("OK", 3)
+    assert (second.status, second.solution) == ("TIMEOUT", None)
+    solver = SlowSolver(input_file=input_file)
+    assert cache.load(cache.key(solver, day=1, part=1)) is not None
+    assert cache.load(cache.key(solver, day=1, part=2)) is None
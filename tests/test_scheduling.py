@@ -0,0 +1,19 @@
+import pytest
+
+from aoc2020.runner import parse_days, run_parallel
+
+
+def test_parse_days():
+    assert parse_days("7") == [7]
+    assert parse_days("1, 3,5-7") == [1, 3, 5, 6, 7]
+    assert parse_days("3-3") == [3]
+
+
+@pytest.mark.parametrize("spec", ["", "5-3", "1,", "1-2-3", "x"])
+def test_invalid_days_are_rejected(spec: str):
+    with pytest.raises(ValueError):
+        parse_days(spec)
+
+
+def test_run_parallel_without_days():
+    assert run_parallel(days=[], demo_only=True) == []
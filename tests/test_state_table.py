@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from aoc2020.solvers.state_table import create_state_table, table_typecode
+
+
+@pytest.mark.parametrize("directory", [False, True])
+def test_zero_filled(tmp_path: Path, directory: bool):
+    table = create_state_table(
+        size=1000, max_value=10, directory=tmp_path if directory else None
+    )
+    assert len(table) == 1000
+    assert not any(table)
+
+
+@pytest.mark.parametrize("directory", [False, True])
+def test_width_follows_max_value(tmp_path: Path, directory: bool):
+    target = tmp_path if directory else None
+    limit = 1 << 32
+    narrow = create_state_table(size=2, max_value=limit - 1, directory=target)
+    wide = create_state_table(size=2, max_value=limit, directory=target)
+    assert table_typecode(narrow) == "I"
+    assert table_typecode(wide) == "Q"
+    wide[1] = 1 << 40
+    assert wide[1] == 1 << 40
+
+
+def test_memory_mapped_file_is_unlinked(tmp_path: Path):
+    table = create_state_table(size=10, max_value=10, directory=tmp_path)
+    table[9] = 3
+    assert list(tmp_path.iterdir()) == []
+    assert table[9] == 3
+
+
+@pytest.mark.parametrize("directory", [False, True])
+def test_empty(tmp_path: Path, directory: bool):
+    table = create_state_table(
+        size=0, max_value=10, directory=tmp_path if directory else None
+    )
+    assert len(table) == 0